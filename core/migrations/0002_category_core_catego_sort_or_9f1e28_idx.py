@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-16 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["sort_order"], name="core_catego_sort_or_9f1e28_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-16 18:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_category_core_catego_sort_or_9f1e28_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["status", "-updated_at"], name="core_articl_status_cb09d4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["category", "-updated_at"],
+                name="core_articl_categor_4ee5e6_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["author", "-updated_at"], name="core_articl_author__7b7e24_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ import re
 import uuid
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.core.validators import (
     EmailValidator,
@@ -13,6 +14,7 @@ from django.core.validators import (
     URLValidator,
 )
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
@@ -126,6 +128,7 @@ class Category(TimestampedModel):
         indexes = [
             models.Index(fields=["is_active", "sort_order"]),
             models.Index(fields=["name"]),
+            models.Index(fields=["sort_order"]),
         ]
 
     def __str__(self):
@@ -308,6 +311,11 @@ class Author(TimestampedModel):
             models.Index(fields=["is_active", "is_featured"]),
             models.Index(fields=["name"]),
             models.Index(fields=["sort_order"]),
+            # Trigram index matching the UPPER(...) LIKE that icontains emits
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="author_name_trgm_idx",
+            ),
         ]
 
     def __str__(self):
@@ -698,6 +706,19 @@ class Article(TimestampedModel):
             models.Index(fields=["scheduled_publish_date"]),
             # Combined indexes for common queries
             models.Index(fields=["status", "is_featured", "-published_date"]),
+            # Dashboard list filters, ordered by last update
+            models.Index(fields=["status", "-updated_at"]),
+            models.Index(fields=["category", "-updated_at"]),
+            models.Index(fields=["author", "-updated_at"]),
+            # Trigram indexes matching the UPPER(...) LIKE that icontains emits
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="article_title_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("excerpt"), name="gin_trgm_ops"),
+                name="article_excerpt_trgm_idx",
+            ),
         ]
         constraints = [
             # Ensure published articles have published_date
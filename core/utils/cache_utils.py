@@ -14,6 +14,8 @@ class CacheManager:
     MEDIA_CACHE_TIMEOUT = 86400  # 24 hours
     SETTINGS_CACHE_TIMEOUT = 3600  # 1 hour
     STATS_CACHE_TIMEOUT = 900  # 15 minutes
+    EDITOR_LOOKUP_CACHE_TIMEOUT = 300  # 5 minutes
+    DASHBOARD_STATS_CACHE_TIMEOUT = 60  # 1 minute
 
     @classmethod
     def get_article_cache_key(cls, slug):
@@ -30,6 +32,16 @@ class CacheManager:
         """Generate cache key for statistics."""
         return f"stats:{stats_type}"
 
+    @classmethod
+    def get_editor_cache_key(cls, lookup):
+        """Generate cache key for a dashboard editor lookup list."""
+        return f"editor:{lookup}"
+
+    @classmethod
+    def invalidate_editor_cache(cls, *lookups):
+        """Invalidate cached dashboard editor lookup lists."""
+        cache.delete_many([cls.get_editor_cache_key(lookup) for lookup in lookups])
+
     @classmethod
     def cache_article(cls, article):
         """Cache article data."""
@@ -1,4 +1,9 @@
+import uuid
+
 from core.models import Article, Author, Category, CloudinaryMedia, Event, Subscriber
+from core.utils.cache_utils import CacheManager
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Count, F, Q, Sum
 from django.utils import timezone
@@ -67,6 +72,15 @@ class DashboardStatsManager:
 
         return stats
 
+    @staticmethod
+    def get_cached_overview_stats():
+        """Get main dashboard statistics, recomputed at most once per TTL"""
+        return cache.get_or_set(
+            CacheManager.get_stats_cache_key("dashboard_overview"),
+            DashboardStatsManager.get_overview_stats,
+            CacheManager.DASHBOARD_STATS_CACHE_TIMEOUT,
+        )
+
     @staticmethod
     def get_recent_activity(limit=10):
         """Get recent activity across the platform"""
@@ -150,23 +164,46 @@ class ArticleManager:
             if article_data.get("tag_ids"):
                 article.tags.set(article_data["tag_ids"])
 
-            # Create content sections
+            # Resolve every referenced media file with one query. Ids are
+            # parsed first so any valid UUID spelling matches its row
+            section_media_ids = []
+            for section_data in sections_data:
+                media_file_id = section_data.get("media_file_id")
+                try:
+                    section_media_ids.append(
+                        uuid.UUID(str(media_file_id)) if media_file_id else None
+                    )
+                except ValueError:
+                    raise ValidationError("Invalid media file ID")
+            media_ids = {media_id for media_id in section_media_ids if media_id}
+            media_map = CloudinaryMedia.objects.in_bulk(media_ids)
+            if len(media_map) != len(media_ids):
+                raise ValidationError("Media file not found")
+
+            # Create content sections with a single multi-row INSERT
             from core.models import ContentSection
 
-            for order, section_data in enumerate(sections_data):
-                ContentSection.objects.create(
-                    article=article,
-                    section_type=section_data["type"],
-                    order=order,
-                    content=section_data.get("content", ""),
-                    title=section_data.get("title", ""),
-                    media_file_id=section_data.get("media_file_id"),
-                    caption=section_data.get("caption", ""),
-                    alt_text=section_data.get("alt_text", ""),
-                    question=section_data.get("question", ""),
-                    answer=section_data.get("answer", ""),
-                    interviewer=section_data.get("interviewer", ""),
-                    interviewee=section_data.get("interviewee", ""),
-                )
+            ContentSection.objects.bulk_create(
+                [
+                    ContentSection(
+                        article=article,
+                        section_type=section_data["type"],
+                        order=order,
+                        content=section_data.get("content", ""),
+                        title=section_data.get("title", ""),
+                        media_file=media_map.get(media_id),
+                        caption=section_data.get("caption", ""),
+                        alt_text=section_data.get("alt_text", ""),
+                        question=section_data.get("question", ""),
+                        answer=section_data.get("answer", ""),
+                        interviewer=section_data.get("interviewer", ""),
+                        interviewee=section_data.get("interviewee", ""),
+                    )
+                    for order, (section_data, media_id) in enumerate(
+                        zip(sections_data, section_media_ids)
+                    )
+                ],
+                batch_size=500,
+            )
 
             return article
@@ -0,0 +1,25 @@
+from core.models import Author, Category, CloudinaryMedia
+from core.utils.cache_utils import CacheManager
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save, sender=CloudinaryMedia)
+@receiver(post_delete, sender=CloudinaryMedia)
+def invalidate_recent_media(sender, **kwargs):
+    """Drop the editor's cached media lists when media changes"""
+    CacheManager.invalidate_editor_cache("recent_media", "recent_images")
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories(sender, **kwargs):
+    """Drop the editor's cached category list when a category changes"""
+    CacheManager.invalidate_editor_cache("categories")
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def invalidate_authors(sender, **kwargs):
+    """Drop the editor's cached author list when an author changes"""
+    CacheManager.invalidate_editor_cache("authors")
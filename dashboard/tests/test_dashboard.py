@@ -1,15 +1,21 @@
-from core.models import Article, Author, Category
-from dashboard.managers import DashboardStatsManager
+import json
+import uuid
+
+from core.models import Article, Author, Category, CloudinaryMedia
+from dashboard import views
+from dashboard.managers import ArticleManager, DashboardStatsManager
 from dashboard.utils.file_processors import FileProcessor
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, TestCase
 from django.urls import reverse
 
 
 class DashboardViewsTest(TestCase):
     def setUp(self):
         self.client = Client()
+        self.factory = RequestFactory()
         self.user = User.objects.create_superuser("admin", "admin@test.com", "password")
         self.category = Category.objects.create(
             name="analysis", display_name="Analysis"
@@ -23,8 +29,6 @@ class DashboardViewsTest(TestCase):
         self.assertContains(response, "Dashboard Overview")
 
     def test_article_creation(self):
-        self.client.login(username="admin", password="password")
-
         article_data = {
             "title": "Test Article",
             "excerpt": "Test excerpt",
@@ -36,33 +40,87 @@ class DashboardViewsTest(TestCase):
             ],
         }
 
-        response = self.client.post(
-            reverse("dashboard:save_article_ajax"),
+        # save_article_ajax isn't routed, so call the view directly
+        request = self.factory.post(
+            "/dashboard/ajax/save-article/",
             data=article_data,
             content_type="application/json",
         )
+        request.user = self.user
+        response = views.save_article_ajax(request)
 
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertTrue(data["success"])
 
     def test_file_upload(self):
-        self.client.login(username="admin", password="password")
-
         # Create a test file
         test_file = SimpleUploadedFile(
             "test.txt", b"Test file content for processing.", content_type="text/plain"
         )
 
-        response = self.client.post(
-            reverse("dashboard:upload_file_ajax"), {"file": test_file}
-        )
+        # upload_file_ajax isn't routed, so call the view directly
+        request = self.factory.post("/dashboard/ajax/upload-file/", {"file": test_file})
+        request.user = self.user
+        response = views.upload_file_ajax(request)
 
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = json.loads(response.content)
         self.assertTrue(data["success"])
 
 
+class ArticleManagerTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser("admin", "admin@test.com", "password")
+        self.category = Category.objects.create(
+            name="analysis", display_name="Analysis"
+        )
+        self.author = Author.objects.create(name="Test Author", email="author@test.com")
+        self.article_data = {
+            "title": "Test Article",
+            "excerpt": "Test excerpt",
+            "category_id": self.category.id,
+            "author_id": self.author.id,
+        }
+
+    def test_create_article_links_non_canonical_media_ids(self):
+        media = CloudinaryMedia.objects.create(
+            title="Test Image",
+            cloudinary_url="https://res.cloudinary.com/demo/image/upload/test.jpg",
+            cloudinary_public_id="test",
+            file_type="image",
+            file_size=1024,
+        )
+        sections_data = [
+            {"type": "image", "media_file_id": str(media.id).upper()},
+            {"type": "image", "media_file_id": media.id.hex},
+            {"type": "paragraph", "content": "Test paragraph content"},
+        ]
+
+        article = ArticleManager.create_article_with_sections(
+            self.article_data, sections_data, self.user
+        )
+
+        self.assertEqual(
+            list(
+                article.content_sections.order_by("order").values_list(
+                    "media_file_id", flat=True
+                )
+            ),
+            [media.id, media.id, None],
+        )
+
+    def test_create_article_rejects_unknown_media_id(self):
+        sections_data = [{"type": "image", "media_file_id": str(uuid.uuid4())}]
+
+        with self.assertRaises(ValidationError):
+            ArticleManager.create_article_with_sections(
+                self.article_data, sections_data, self.user
+            )
+
+        self.assertFalse(Article.objects.exists())
+
+
 class FileProcessorTest(TestCase):
     def test_text_file_processing(self):
         test_file = SimpleUploadedFile(
@@ -79,6 +137,7 @@ class FileProcessorTest(TestCase):
 
 class DashboardStatsTest(TestCase):
     def setUp(self):
+        self.user = User.objects.create_superuser("admin", "admin@test.com", "password")
         self.category = Category.objects.create(
             name="analysis", display_name="Analysis"
         )
@@ -92,6 +151,8 @@ class DashboardStatsTest(TestCase):
             category=self.category,
             author=self.author,
             status="published",
+            created_by=self.user,
+            last_modified_by=self.user,
         )
 
         stats = DashboardStatsManager.get_overview_stats()
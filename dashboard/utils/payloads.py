@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import orjson
+from django.core.exceptions import ValidationError
+
+
+def _text(data, key, default=""):
+    """Return a string field from the payload, treating null as the default"""
+    value = data.get(key)
+    return value if isinstance(value, str) else default
+
+
+@dataclass(slots=True)
+class ArticlePayload:
+    """Normalized body of a save-article request"""
+
+    title: str
+    article_id: Optional[str] = None
+    excerpt: str = ""
+    category_id: Optional[str] = None
+    author_id: Optional[str] = None
+    featured_image_id: Optional[str] = None
+    status: str = "draft"
+    content: str = ""
+    meta_title: str = ""
+    meta_description: str = ""
+    meta_keywords: str = ""
+    tags: List[str] = field(default_factory=list)
+    publication_date: str = ""
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "ArticlePayload":
+        """
+        Parse and normalize a JSON request body.
+
+        Raises orjson.JSONDecodeError for malformed JSON and ValidationError
+        when the body is not a JSON object.
+        """
+        data = orjson.loads(raw)
+        if not isinstance(data, dict):
+            raise ValidationError("Article data must be a JSON object")
+
+        tags = data.get("tags")
+        return cls(
+            article_id=data.get("id") or data.get("article_id"),
+            title=_text(data, "title").strip(),
+            excerpt=_text(data, "excerpt").strip(),
+            category_id=data.get("category_id"),
+            author_id=data.get("author_id"),
+            featured_image_id=_text(data, "featured_image_id") or None,
+            status=_text(data, "status", "draft"),
+            content=_text(data, "content"),
+            meta_title=_text(data, "meta_title"),
+            meta_description=_text(data, "meta_description"),
+            meta_keywords=_text(data, "meta_keywords"),
+            tags=(
+                [tag for tag in tags if isinstance(tag, str)]
+                if isinstance(tags, list)
+                else []
+            ),
+            publication_date=_text(data, "publication_date"),
+        )
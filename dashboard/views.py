@@ -1,7 +1,9 @@
-import json
 import logging
+import re
 from functools import wraps
 
+import orjson
+
 from core.forms import ArticleForm, ContentSectionFormSet
 from core.models import (
     Article,
@@ -15,19 +17,23 @@ from core.models import (
     Tag,
 )
 from core.serializers import MediaUploadSerializer
+from core.utils.cache_utils import CacheManager
 from core.utils.cloudinary_utils import CloudinaryManager
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.paginator import Paginator
 from django.core.validators import validate_email
-from django.db import transaction
-from django.db.models import Q
-from django.http import HttpResponseForbidden, JsonResponse
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
@@ -44,9 +50,51 @@ from django.views.generic import (
 from .managers import ArticleManager, DashboardStatsManager
 from .utils.file_processors import ContentGenerator, FileProcessor
 from .utils.media_optimizer import MediaOptimizer
+from .utils.payloads import ArticlePayload
 
 logger = logging.getLogger(__name__)
 
+# ContentSection columns copied when duplicating an article
+SECTION_COPY_FIELDS = (
+    "section_type",
+    "order",
+    "content",
+    "title",
+    "media_file_id",
+    "caption",
+    "alt_text",
+    "question",
+    "answer",
+    "interviewer",
+    "interviewee",
+    "list_items",
+    "table_data",
+    "embed_code",
+    "css_classes",
+    "background_color",
+    "is_visible",
+    "is_expandable",
+)
+
+# Maximum number of ids per DELETE statement in bulk article operations
+BULK_DELETE_BATCH_SIZE = 500
+
+# Validation patterns for category creation
+CATEGORY_NAME_RE = re.compile(r"^[a-z0-9_]+$")
+COLOR_CODE_RE = re.compile(r"^#[0-9a-fA-F]{6}$")
+
+# Translation table used to build tag slugs from tag names
+TAG_SLUG_TRANS = str.maketrans({" ": "-"})
+
+
+def json_response(data, status=200):
+    """Render data as a JSON response, encoded with orjson"""
+    return HttpResponse(
+        orjson.dumps(data, default=str),
+        status=status,
+        content_type="application/json",
+    )
+
 
 def is_admin_user(user):
     """Check if user has admin privileges"""
@@ -98,7 +146,7 @@ def ajax_admin_required(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         if not request.user.is_authenticated:
-            return JsonResponse(
+            return json_response(
                 {
                     "success": False,
                     "error": "Authentication required",
@@ -111,12 +159,27 @@ def ajax_admin_required(view_func):
             logger.warning(
                 f"User {request.user.username} attempted to access admin AJAX endpoint at {request.path}"
             )
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Administrator privileges required"},
                 status=403,
             )
 
-        return view_func(request, *args, **kwargs)
+        try:
+            return view_func(request, *args, **kwargs)
+        except Http404:
+            return json_response(
+                {"success": False, "error": "Resource not found"}, status=404
+            )
+        except Exception:
+            # Single catch-all for AJAX endpoints; views only handle the
+            # error types they can give a meaningful message for.
+            logger.exception(
+                f"Unhandled error in {request.path} for {request.user.username}"
+            )
+            return json_response(
+                {"success": False, "error": "An unexpected error occurred"},
+                status=500,
+            )
 
     return wrapper
 
@@ -158,13 +221,15 @@ class DashboardHomeView(AdminRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        return ArticleManager.get_optimized_articles_list()[:10]
+        # The recent articles table only shows FK columns, so drop the
+        # tags/content_sections prefetches that would run two unused queries
+        return ArticleManager.get_optimized_articles_list().prefetch_related(None)[:10]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
         # Get real dashboard statistics
-        stats = DashboardStatsManager.get_overview_stats()
+        stats = DashboardStatsManager.get_cached_overview_stats()
         recent_activity = DashboardStatsManager.get_recent_activity()
         popular_content = DashboardStatsManager.get_popular_content()
 
@@ -173,10 +238,12 @@ class DashboardHomeView(AdminRequiredMixin, ListView):
                 "stats": stats,
                 "recent_activity": recent_activity,
                 "popular_content": popular_content,
-                "pending_reviews": Article.objects.filter(status="review")[:5],
-                "scheduled_posts": Article.objects.filter(status="scheduled").order_by(
-                    "scheduled_publish_date"
-                )[:5],
+                "pending_reviews": Article.objects.filter(
+                    status="review"
+                ).select_related("category", "author", "featured_image")[:5],
+                "scheduled_posts": Article.objects.filter(status="scheduled")
+                .select_related("category", "author", "featured_image")
+                .order_by("scheduled_publish_date")[:5],
                 "user": self.request.user,  # Add user context for welcome message
             }
         )
@@ -193,7 +260,27 @@ def get_article_data(request, article_id):
 
         # Get content sections
         content_sections = []
-        for section in article.content_sections.all().order_by("order"):
+        # Fetch each section's media in the same query, loading only the
+        # columns serialized below
+        sections = (
+            article.content_sections.select_related("media_file")
+            .only(
+                "id",
+                "article",
+                "section_type",
+                "content",
+                "title",
+                "order",
+                "media_file",
+                "media_file__id",
+                "caption",
+                "alt_text",
+                "question",
+                "answer",
+            )
+            .order_by("order")
+        )
+        for section in sections:
             section_data = {
                 "id": str(section.id),
                 "type": section.section_type,
@@ -233,15 +320,42 @@ def get_article_data(request, article_id):
             "allow_comments": article.allow_comments,
         }
 
-        return JsonResponse({"success": True, "article": article_data})
+        return json_response({"success": True, "article": article_data})
 
     except Article.DoesNotExist:
-        return JsonResponse(
+        return json_response(
             {"success": False, "error": "Article not found"}, status=404
         )
-    except Exception as e:
-        logger.error(f"Error getting article data: {str(e)}")
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+
+
+# Dropdown and media picker lists shared by the article pages
+_EDITOR_LOOKUPS = {
+    "categories": lambda: list(
+        Category.objects.filter(is_active=True).order_by("sort_order", "display_name")
+    ),
+    "authors": lambda: list(Author.objects.filter(is_active=True).order_by("name")),
+    "recent_media": lambda: list(CloudinaryMedia.objects.order_by("-created_at")[:50]),
+    "recent_images": lambda: list(
+        CloudinaryMedia.objects.filter(file_type="image").order_by("-created_at")[:20]
+    ),
+}
+
+
+def get_editor_lookup_context(*lookups):
+    """
+    Return the named editor lookup lists.
+
+    They change rarely, so each is cached; dashboard.signals drops them when
+    a category, author or media file is saved or deleted.
+    """
+    return {
+        lookup: cache.get_or_set(
+            CacheManager.get_editor_cache_key(lookup),
+            _EDITOR_LOOKUPS[lookup],
+            CacheManager.EDITOR_LOOKUP_CACHE_TIMEOUT,
+        )
+        for lookup in lookups
+    }
 
 
 class ArticleCreateView(AdminRequiredMixin, TemplateView):
@@ -253,25 +367,17 @@ class ArticleCreateView(AdminRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Get categories and authors for dropdowns
-        categories = Category.objects.filter(is_active=True).order_by(
-            "sort_order", "display_name"
+        # Categories and authors for dropdowns, plus media for the library
+        lookups = get_editor_lookup_context(
+            "categories", "authors", "recent_media", "recent_images"
         )
-        authors = Author.objects.filter(is_active=True).order_by("name")
-
-        # Get media files for the media library
-        recent_media = CloudinaryMedia.objects.filter(file_type="image").order_by(
-            "-created_at"
-        )[:20]
-
-        all_media = CloudinaryMedia.objects.order_by("-created_at")[:50]
 
         context.update(
             {
-                "categories": categories,
-                "authors": authors,
-                "recent_media": recent_media,
-                "all_media": all_media,
+                "categories": lookups["categories"],
+                "authors": lookups["authors"],
+                "recent_media": lookups["recent_images"],
+                "all_media": lookups["recent_media"],
                 "csrf_token": self.request.META.get("CSRF_COOKIE"),
             }
         )
@@ -291,10 +397,8 @@ def article_editor_view(request, article_id=None):
 
     context = {
         "article": article,
-        "categories": Category.objects.filter(is_active=True),
-        "authors": Author.objects.filter(is_active=True),
+        **get_editor_lookup_context("categories", "authors", "recent_media"),
         "tags": Tag.objects.all().order_by("name"),
-        "recent_media": CloudinaryMedia.objects.order_by("-created_at")[:50],
         "default_structure": ContentGenerator.get_default_structure(),
     }
 
@@ -304,9 +408,10 @@ def article_editor_view(request, article_id=None):
 @admin_required(message="Please sign in to access the media library.")
 def media_library_view(request):
     """Media library with pagination and search - Protected"""
-    media_list = CloudinaryMedia.objects.select_related("uploaded_by").order_by(
-        "-created_at"
-    )
+    # The grid only shows these columns; the Paginator slices this lazily
+    media_list = CloudinaryMedia.objects.only(
+        "id", "title", "cloudinary_url", "alt_text", "file_type", "file_size"
+    ).order_by("-created_at")
 
     # Apply filters
     file_type = request.GET.get("type")
@@ -338,9 +443,28 @@ def media_library_view(request):
 @admin_required()
 def articles_list_view(request):
     """Display all articles with filtering and pagination - Protected"""
-    articles = Article.objects.select_related(
-        "category", "author", "featured_image"
-    ).order_by("-updated_at")
+    # Only select the columns the list table renders
+    articles = (
+        Article.objects.select_related("category", "author")
+        .only(
+            "id",
+            "title",
+            "slug",
+            "excerpt",
+            "status",
+            "is_featured",
+            "is_breaking",
+            "view_count",
+            "share_count",
+            "published_date",
+            "updated_at",
+            "category__display_name",
+            "category__color_code",
+            "author__name",
+            "author__title",
+        )
+        .order_by("-updated_at")
+    )
 
     # Apply filters
     search = request.GET.get("search")
@@ -368,16 +492,10 @@ def articles_list_view(request):
     page_number = request.GET.get("page")
     articles_page = paginator.get_page(page_number)
 
-    # Get filter options
-    categories = Category.objects.filter(is_active=True).order_by(
-        "sort_order", "display_name"
-    )
-    authors = Author.objects.filter(is_active=True).order_by("name")
-
     context = {
         "articles": articles_page,
-        "categories": categories,
-        "authors": authors,
+        # Filter options
+        **get_editor_lookup_context("categories", "authors"),
     }
 
     return render(request, "dashboard/articles_list.html", context)
@@ -459,21 +577,17 @@ def article_edit_view(request, article_id):
     article = get_object_or_404(Article, id=article_id)
 
     # Get content sections ordered properly
-    content_sections = article.content_sections.all().order_by("order")
-
-    # Get dropdown options
-    categories = Category.objects.filter(is_active=True).order_by(
-        "sort_order", "display_name"
-    )
-    authors = Author.objects.filter(is_active=True).order_by("name")
-    recent_media = CloudinaryMedia.objects.order_by("-created_at")[:50]
+    content_sections = article.content_sections.order_by("order")
+    # The editor body renders the first section; resolve it once here instead
+    # of letting the template query it twice
+    main_section = content_sections.first()
 
     context = {
         "article": article,
         "content_sections": content_sections,
-        "categories": categories,
-        "authors": authors,
-        "recent_media": recent_media,
+        "main_section": main_section,
+        # Dropdown options
+        **get_editor_lookup_context("categories", "authors", "recent_media"),
         "is_edit_mode": True,
     }
 
@@ -515,13 +629,13 @@ def user_manual_view(request):
 def save_article_ajax(request):
     """Save article via AJAX with proper validation - Protected"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
 
         # Validate required fields
         required_fields = ["title", "excerpt", "category_id", "author_id"]
         for field in required_fields:
             if not data.get(field):
-                return JsonResponse(
+                return json_response(
                     {
                         "success": False,
                         "error": f'{field.replace("_", " ").title()} is required',
@@ -547,14 +661,33 @@ def save_article_ajax(request):
         # Create or update article
         article_id = data.get("article_id")
         if article_id:
-            article = get_object_or_404(Article, id=article_id)
-            # Update existing article
-            for key, value in article_data.items():
-                if key != "tag_ids":
-                    setattr(article, key, value)
-            article.last_modified_by = request.user
-            article.save()
+            # Update existing article with a single UPDATE instead of
+            # fetch + full save(); mirror the defaults Article.save() applies
+            now = timezone.now()
+            scalar_fields = {
+                key: value for key, value in article_data.items() if key != "tag_ids"
+            }
+            scalar_fields["featured_image_id"] = (
+                article_data["featured_image_id"] or None
+            )
+            scalar_fields["meta_title"] = (
+                article_data["meta_title"] or article_data["title"][:60]
+            )
+            scalar_fields["meta_description"] = (
+                article_data["meta_description"] or article_data["excerpt"][:160]
+            )
+            if article_data["status"] == "published":
+                scalar_fields["published_date"] = Coalesce("published_date", Value(now))
 
+            updated = Article.objects.filter(pk=article_id).update(
+                last_modified_by=request.user, updated_at=now, **scalar_fields
+            )
+            if not updated:
+                return json_response(
+                    {"success": False, "error": "Article not found"}, status=404
+                )
+
+            article = Article(pk=article_id, title=article_data["title"])
             if article_data["tag_ids"]:
                 article.tags.set(article_data["tag_ids"])
         else:
@@ -565,7 +698,7 @@ def save_article_ajax(request):
 
         logger.info(f"Article '{article.title}' saved by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "article_id": str(article.id),
@@ -574,11 +707,17 @@ def save_article_ajax(request):
             }
         )
 
-    except Exception as e:
-        logger.error(f"Error saving article by {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": "An error occurred while saving the article"},
-            status=500,
+    except orjson.JSONDecodeError:
+        return json_response(
+            {"success": False, "error": "Invalid JSON data"}, status=400
+        )
+    except ValidationError as e:
+        return json_response({"success": False, "error": e.messages[0]}, status=400)
+    except IntegrityError:
+        logger.warning(f"Integrity error saving article by {request.user.username}")
+        return json_response(
+            {"success": False, "error": "Article conflicts with existing data"},
+            status=400,
         )
 
 
@@ -590,7 +729,7 @@ def upload_file_ajax(request):
     try:
         uploaded_file = request.FILES.get("file")
         if not uploaded_file:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "No file uploaded"}, status=400
             )
 
@@ -611,7 +750,7 @@ def upload_file_ajax(request):
                     f"Document processed by {request.user.username}: {uploaded_file.name}"
                 )
 
-                return JsonResponse(
+                return json_response(
                     {
                         "success": True,
                         "file_type": "document",
@@ -620,7 +759,7 @@ def upload_file_ajax(request):
                     }
                 )
             else:
-                return JsonResponse(
+                return json_response(
                     {"success": False, "error": processed_file["error"]}, status=400
                 )
 
@@ -630,7 +769,7 @@ def upload_file_ajax(request):
 
             logger.info(f"Media uploaded by {request.user.username}: {media.title}")
 
-            return JsonResponse(
+            return json_response(
                 {
                     "success": True,
                     "file_type": "media",
@@ -645,9 +784,8 @@ def upload_file_ajax(request):
                 }
             )
 
-    except Exception as e:
-        logger.error(f"Error uploading file by {request.user.username}: {str(e)}")
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    except ValidationError as e:
+        return json_response({"success": False, "error": e.messages[0]}, status=400)
 
 
 @csrf_exempt
@@ -659,8 +797,6 @@ def delete_media_ajax(request, media_id):
         media = get_object_or_404(CloudinaryMedia, id=media_id)
 
         # Delete from Cloudinary
-        from core.utils.cloudinary_utils import CloudinaryManager
-
         delete_result = CloudinaryManager.delete_file(
             media.cloudinary_public_id,
             resource_type="image" if media.file_type == "image" else "raw",
@@ -672,18 +808,21 @@ def delete_media_ajax(request, media_id):
 
             logger.info(f"Media deleted by {request.user.username}: {media_title}")
 
-            return JsonResponse(
+            return json_response(
                 {"success": True, "message": "Media deleted successfully"}
             )
         else:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Failed to delete from Cloudinary"},
                 status=500,
             )
 
-    except Exception as e:
-        logger.error(f"Error deleting media by {request.user.username}: {str(e)}")
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    except IntegrityError:
+        logger.warning(f"Integrity error deleting media by {request.user.username}")
+        return json_response(
+            {"success": False, "error": "Media is still referenced by content"},
+            status=400,
+        )
 
 
 @csrf_exempt
@@ -691,14 +830,8 @@ def delete_media_ajax(request, media_id):
 @require_http_methods(["GET"])
 def get_dashboard_stats_ajax(request):
     """Get dashboard statistics via AJAX - Protected"""
-    try:
-        stats = DashboardStatsManager.get_overview_stats()
-        return JsonResponse({"success": True, "stats": stats})
-    except Exception as e:
-        logger.error(
-            f"Error getting dashboard stats for {request.user.username}: {str(e)}"
-        )
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    stats = DashboardStatsManager.get_cached_overview_stats()
+    return json_response({"success": True, "stats": stats})
 
 
 @csrf_exempt
@@ -709,7 +842,7 @@ def upload_file_view(request):
     try:
         # Validate file upload
         if "file" not in request.FILES:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "No file provided"}, status=400
             )
 
@@ -717,7 +850,7 @@ def upload_file_view(request):
 
         # Validate file size (10MB limit)
         if file_obj.size > 10 * 1024 * 1024:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "File too large. Maximum size is 10MB."},
                 status=400,
             )
@@ -733,7 +866,7 @@ def upload_file_view(request):
             "application/pdf",
         ]
         if file_obj.content_type not in allowed_types:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "File type not allowed"}, status=400
             )
 
@@ -759,7 +892,7 @@ def upload_file_view(request):
             )
 
             if not upload_result["success"]:
-                return JsonResponse(
+                return json_response(
                     {"success": False, "error": upload_result["error"]}, status=500
                 )
 
@@ -781,7 +914,7 @@ def upload_file_view(request):
 
             logger.info(f"File uploaded by {request.user.username}: {media.title}")
 
-            return JsonResponse(
+            return json_response(
                 {
                     "success": True,
                     "message": "File uploaded successfully",
@@ -795,17 +928,17 @@ def upload_file_view(request):
                 }
             )
 
-        except Exception as cloudinary_error:
-            logger.error(f"Cloudinary upload failed: {str(cloudinary_error)}")
-            return JsonResponse(
-                {"success": False, "error": f"Upload failed: {str(cloudinary_error)}"},
-                status=500,
+        except ValidationError as e:
+            return json_response(
+                {"success": False, "error": f"Upload failed: {e.messages[0]}"},
+                status=400,
             )
 
-    except Exception as e:
-        logger.error(f"Upload failed for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Upload failed: {str(e)}"}, status=500
+    except IntegrityError:
+        logger.warning(f"Duplicate media upload by {request.user.username}")
+        return json_response(
+            {"success": False, "error": "Upload failed: media already exists"},
+            status=400,
         )
 
 
@@ -818,7 +951,7 @@ def delete_media_view(request, media_id):
 
         # Check permissions (optional)
         if request.user != media.uploaded_by and not request.user.is_staff:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Permission denied"}, status=403
             )
 
@@ -834,18 +967,19 @@ def delete_media_view(request, media_id):
 
         logger.info(f"Media deleted by {request.user.username}: {media_title}")
 
-        return JsonResponse(
+        return json_response(
             {"success": True, "message": "Media file deleted successfully"}
         )
 
     except CloudinaryMedia.DoesNotExist:
-        return JsonResponse(
+        return json_response(
             {"success": False, "error": "Media file not found"}, status=404
         )
-    except Exception as e:
-        logger.error(f"Delete failed for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Delete failed: {str(e)}"}, status=500
+    except IntegrityError:
+        logger.warning(f"Integrity error deleting media by {request.user.username}")
+        return json_response(
+            {"success": False, "error": "Delete failed: media is still in use"},
+            status=400,
         )
 
 
@@ -857,44 +991,63 @@ def delete_media_view(request, media_id):
 def bulk_articles_view(request):
     """Handle bulk operations on articles - Protected"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         article_ids = data.get("article_ids", [])
         action = data.get("action")
 
         if not article_ids or not action:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Missing article IDs or action"}, status=400
             )
 
         articles = Article.objects.filter(id__in=article_ids)
 
         if action == "publish":
-            articles.update(status="published", published_date=timezone.now())
+            affected = articles.update(
+                status="published", published_date=timezone.now()
+            )
         elif action == "draft":
-            articles.update(status="draft")
+            affected = articles.update(status="draft")
         elif action == "archive":
-            articles.update(status="archived")
+            affected = articles.update(status="archived")
         elif action == "delete":
-            articles.delete()
+            # Delete in chunks so each statement keeps a small IN clause
+            affected = 0
+            with transaction.atomic():
+                for start in range(0, len(article_ids), BULK_DELETE_BATCH_SIZE):
+                    _, deleted = Article.objects.filter(
+                        id__in=article_ids[start : start + BULK_DELETE_BATCH_SIZE]
+                    ).delete()
+                    affected += deleted.get(Article._meta.label, 0)
         else:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Invalid action"}, status=400
             )
 
         logger.info(
-            f"Bulk action '{action}' on {len(article_ids)} articles by {request.user.username}"
+            f"Bulk action '{action}' on {affected} articles by {request.user.username}"
         )
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
-                "message": f"Successfully {action}ed {len(article_ids)} article(s)",
+                "message": f"Successfully {action}ed {affected} article(s)",
+                "affected": affected,
             }
         )
 
-    except Exception as e:
-        logger.error(f"Bulk operation failed for {request.user.username}: {str(e)}")
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    except orjson.JSONDecodeError:
+        return json_response(
+            {"success": False, "error": "Invalid JSON data"}, status=400
+        )
+    except ValidationError as e:
+        return json_response({"success": False, "error": e.messages[0]}, status=400)
+    except IntegrityError:
+        logger.warning(f"Bulk operation rejected for {request.user.username}")
+        return json_response(
+            {"success": False, "error": "Bulk operation violates data constraints"},
+            status=400,
+        )
 
 
 @csrf_exempt
@@ -903,164 +1056,199 @@ def bulk_articles_view(request):
 def save_article_view(request):
     """Enhanced save article view that handles both create and update - Protected"""
     try:
-        data = json.loads(request.body)
-
-        # Extract data with proper validation
-        article_id = data.get("id") or data.get("article_id")
-        title = data.get("title", "").strip()
-        excerpt = data.get("excerpt", "").strip()
-        category_id = data.get("category_id")
-        author_id = data.get("author_id")
-        featured_image_id = data.get("featured_image_id")
-        status = data.get("status", "draft")
-        content = data.get("content", "")
-        meta_title = data.get("meta_title", "")
-        meta_description = data.get("meta_description", "")
-        meta_keywords = data.get("meta_keywords", "")
-        tags = data.get("tags", [])
-        publication_date = data.get("publication_date", "")
+        # Parse and normalize the request body in one pass
+        payload = ArticlePayload.from_json(request.body)
+        author_id = payload.author_id
 
         # Basic validation
-        if not title:
-            return JsonResponse(
+        if not payload.title:
+            return json_response(
                 {"success": False, "error": "Article title is required"}, status=400
             )
 
         # Validate required foreign keys
         if not author_id:
             # Default to current user if no author specified and user has an author profile
-            try:
-                default_author = Author.objects.filter(user=request.user).first()
-                if default_author:
-                    author_id = str(default_author.id)
-                else:
-                    return JsonResponse(
-                        {"success": False, "error": "Author is required"}, status=400
-                    )
-            except:
-                return JsonResponse(
+            default_author = Author.objects.filter(user=request.user).first()
+            if default_author:
+                author_id = str(default_author.id)
+            else:
+                return json_response(
                     {"success": False, "error": "Author is required"}, status=400
                 )
 
-        if not category_id:
-            return JsonResponse(
+        if not payload.category_id:
+            return json_response(
                 {"success": False, "error": "Category is required"}, status=400
             )
 
         # Get or create article
         with transaction.atomic():
-            if article_id:
-                try:
-                    article = Article.objects.get(id=article_id)
-                    message = "Article updated successfully"
-                    is_update = True
-                except Article.DoesNotExist:
-                    return JsonResponse(
+            if payload.article_id:
+                # Only load what the view reads; the save() below names the
+                # columns it writes, leaving counters such as view_count alone
+                article = (
+                    Article.objects.filter(id=payload.article_id)
+                    .only("id", "slug", "published_date", "updated_at")
+                    .first()
+                )
+                if article is None:
+                    return json_response(
                         {"success": False, "error": "Article not found"}, status=404
                     )
+                message = "Article updated successfully"
+                is_update = True
             else:
                 article = Article(created_by=request.user)
                 message = "Article created successfully"
                 is_update = False
 
+            # Columns written on update; save() only touches these
+            dirty_fields = {
+                "title",
+                "excerpt",
+                "status",
+                "meta_title",
+                "meta_description",
+                "meta_keywords",
+                "last_modified_by",
+                "category",
+                "author",
+                "featured_image",
+                "published_date",
+                "updated_at",
+            }
+
             # Update article fields
-            article.title = title
-            article.excerpt = excerpt
-            article.status = status
-            article.meta_title = meta_title
-            article.meta_description = meta_description
-            article.meta_keywords = meta_keywords
+            article.title = payload.title
+            article.excerpt = payload.excerpt
+            article.status = payload.status
+            article.meta_title = payload.meta_title
+            article.meta_description = payload.meta_description
+            article.meta_keywords = payload.meta_keywords
             article.last_modified_by = request.user
 
-            # Handle foreign key relationships with proper validation
+            # Handle foreign key relationships with proper validation; only the
+            # ids are needed, so check existence instead of loading the rows
             try:
-                article.category = Category.objects.get(id=category_id)
-            except (Category.DoesNotExist, ValueError):
-                return JsonResponse(
+                category_exists = Category.objects.filter(
+                    id=payload.category_id
+                ).exists()
+            except (ValueError, ValidationError):
+                category_exists = False
+            if not category_exists:
+                return json_response(
                     {"success": False, "error": "Invalid category selected"}, status=400
                 )
+            article.category_id = payload.category_id
 
             try:
-                article.author = Author.objects.get(id=author_id)
-            except (Author.DoesNotExist, ValueError):
-                return JsonResponse(
+                author_exists = Author.objects.filter(id=author_id).exists()
+            except (ValueError, ValidationError):
+                author_exists = False
+            if not author_exists:
+                return json_response(
                     {"success": False, "error": "Invalid author selected"}, status=400
                 )
+            article.author_id = author_id
 
-            # Handle featured image
-            if featured_image_id:
-                if featured_image_id.startswith("http"):
+            # Handle featured image; resolve to a primary key only so the
+            # single save() below writes the FK without loading the media row
+            resolved_featured_id = None
+            if payload.featured_image_id:
+                if payload.featured_image_id.startswith("http"):
                     # This is a URL, find the media by URL
-                    try:
-                        article.featured_image = CloudinaryMedia.objects.filter(
-                            cloudinary_url=featured_image_id
-                        ).first()
-                    except:
-                        article.featured_image = None
+                    media_lookup = {"cloudinary_url": payload.featured_image_id}
                 else:
                     # This should be an ID
-                    try:
-                        article.featured_image = CloudinaryMedia.objects.get(
-                            id=featured_image_id
-                        )
-                    except (CloudinaryMedia.DoesNotExist, ValueError):
-                        article.featured_image = None
-            else:
-                article.featured_image = None
+                    media_lookup = {"id": payload.featured_image_id}
+                try:
+                    resolved_featured_id = (
+                        CloudinaryMedia.objects.filter(**media_lookup)
+                        .values_list("id", flat=True)
+                        .first()
+                    )
+                except (ValueError, ValidationError):
+                    resolved_featured_id = None
+            article.featured_image_id = resolved_featured_id
 
             # Handle publication date
-            if publication_date:
+            if payload.publication_date:
                 try:
-                    from django.utils.dateparse import parse_datetime
-
-                    parsed_date = parse_datetime(publication_date)
+                    parsed_date = parse_datetime(payload.publication_date)
                     if parsed_date:
-                        if status == "published":
+                        if payload.status == "published":
                             article.published_date = parsed_date
-                        elif status == "scheduled":
+                        elif payload.status == "scheduled":
                             article.scheduled_publish_date = parsed_date
-                except:
+                            dirty_fields.add("scheduled_publish_date")
+                except ValueError:
                     pass
 
             # Set published date if publishing for the first time
-            if status == "published" and not article.published_date:
+            if payload.status == "published" and not article.published_date:
                 article.published_date = timezone.now()
 
             # Save article
-            article.save()
+            if is_update:
+                article.save(update_fields=dirty_fields)
+            else:
+                article.save()
 
             # Handle content - store in a single ContentSection or update existing
-            if content and content.strip():
-                # Clear existing sections for updates, or create new one
+            if payload.content.strip():
+                section_fields = {
+                    "section_type": "paragraph",
+                    "content": payload.content,
+                    "title": "Main Content",
+                }
                 if is_update:
-                    ContentSection.objects.filter(article=article).delete()
-
-                # Create a single content section with the HTML content
-                ContentSection.objects.create(
-                    article=article,
-                    section_type="paragraph",
-                    order=0,
-                    content=content,
-                    title="Main Content",
+                    # Drop any legacy extra sections and update the main
+                    # section in place instead of deleting and re-inserting it
+                    ContentSection.objects.filter(article=article).exclude(
+                        order=0
+                    ).delete()
+                    ContentSection.objects.update_or_create(
+                        article=article, order=0, defaults=section_fields
+                    )
+                else:
+                    ContentSection.objects.create(
+                        article=article, order=0, **section_fields
+                    )
+
+            # Handle tags: resolve all names with one lookup and one insert
+            if payload.tags:
+                names = {name for name in map(str.strip, payload.tags) if name}
+                existing = set(
+                    Tag.objects.filter(name__in=names).values_list("name", flat=True)
+                )
+                Tag.objects.bulk_create(
+                    [
+                        Tag(name=name, slug=name.lower().translate(TAG_SLUG_TRANS))
+                        for name in names - existing
+                    ],
+                    ignore_conflicts=True,
                 )
 
-            # Handle tags
-            if tags and isinstance(tags, list):
-                article.tags.clear()
-
-                for tag_name in tags:
-                    if tag_name.strip():
-                        tag, created = Tag.objects.get_or_create(
-                            name=tag_name.strip(),
-                            defaults={
-                                "slug": tag_name.strip().lower().replace(" ", "-")
-                            },
+                # Replace the M2M rows directly through the join table: one
+                # DELETE and one multi-row INSERT regardless of tag count
+                ArticleTag = Article.tags.through
+                if is_update:
+                    ArticleTag.objects.filter(article_id=article.id).delete()
+                ArticleTag.objects.bulk_create(
+                    [
+                        ArticleTag(article_id=article.id, tag_id=tag_id)
+                        for tag_id in Tag.objects.filter(name__in=names).values_list(
+                            "id", flat=True
                         )
-                        article.tags.add(tag)
+                    ],
+                    ignore_conflicts=True,
+                    batch_size=500,
+                )
 
-        logger.info(f"Article '{title}' saved by {request.user.username}")
+        logger.info(f"Article '{payload.title}' saved by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "message": message,
@@ -1072,14 +1260,23 @@ def save_article_view(request):
             }
         )
 
-    except json.JSONDecodeError:
-        return JsonResponse(
+    except orjson.JSONDecodeError:
+        return json_response(
             {"success": False, "error": "Invalid JSON data"}, status=400
         )
-    except Exception as e:
-        logger.error(f"Failed to save article for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Failed to save article: {str(e)}"}, status=500
+    except ValidationError as e:
+        return json_response(
+            {"success": False, "error": f"Failed to save article: {e.messages[0]}"},
+            status=400,
+        )
+    except IntegrityError:
+        logger.warning(f"Integrity error saving article by {request.user.username}")
+        return json_response(
+            {
+                "success": False,
+                "error": "Failed to save article: conflicts with existing data",
+            },
+            status=400,
         )
 
 
@@ -1088,11 +1285,13 @@ def save_article_view(request):
 def delete_article_view(request, article_id):
     """Delete a single article - Protected"""
     try:
-        article = get_object_or_404(Article, id=article_id)
+        article = get_object_or_404(
+            Article.objects.only("id", "title", "created_by_id"), id=article_id
+        )
 
         # Check permissions (optional - you might want only authors or admins to delete)
-        if not request.user.is_staff and article.created_by != request.user:
-            return JsonResponse(
+        if not request.user.is_staff and article.created_by_id != request.user.id:
+            return json_response(
                 {"success": False, "error": "Permission denied"}, status=403
             )
 
@@ -1101,7 +1300,7 @@ def delete_article_view(request, article_id):
 
         logger.info(f"Article '{article_title}' deleted by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "message": f'Article "{article_title}" deleted successfully',
@@ -1109,14 +1308,17 @@ def delete_article_view(request, article_id):
         )
 
     except Article.DoesNotExist:
-        return JsonResponse(
+        return json_response(
             {"success": False, "error": "Article not found"}, status=404
         )
-    except Exception as e:
-        logger.error(f"Failed to delete article for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Failed to delete article: {str(e)}"},
-            status=500,
+    except IntegrityError:
+        logger.warning(f"Integrity error deleting article by {request.user.username}")
+        return json_response(
+            {
+                "success": False,
+                "error": "Failed to delete article: it is still referenced",
+            },
+            status=400,
         )
 
 
@@ -1125,41 +1327,40 @@ def delete_article_view(request, article_id):
 def toggle_featured_view(request, article_id):
     """Toggle the featured status of an article - Protected"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         is_featured = data.get("is_featured", False)
 
-        article = get_object_or_404(Article, id=article_id)
-        article.is_featured = is_featured
-        article.last_modified_by = request.user
-        article.save(update_fields=["is_featured", "updated_at", "last_modified_by"])
+        # Single UPDATE; no need to load the article to flip one flag
+        updated = Article.objects.filter(id=article_id).update(
+            is_featured=is_featured,
+            last_modified_by=request.user,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            return json_response(
+                {"success": False, "error": "Article not found"}, status=404
+            )
 
         status_text = "featured" if is_featured else "removed from featured"
 
-        logger.info(
-            f"Article '{article.title}' {status_text} by {request.user.username}"
-        )
+        logger.info(f"Article {article_id} {status_text} by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
-                "message": f'Article "{article.title}" {status_text}',
-                "is_featured": article.is_featured,
+                "message": f"Article {status_text}",
+                "is_featured": is_featured,
             }
         )
 
-    except Article.DoesNotExist:
-        return JsonResponse(
-            {"success": False, "error": "Article not found"}, status=404
-        )
-    except json.JSONDecodeError:
-        return JsonResponse(
+    except orjson.JSONDecodeError:
+        return json_response(
             {"success": False, "error": "Invalid JSON data"}, status=400
         )
-    except Exception as e:
-        logger.error(f"Failed to update article for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Failed to update article: {str(e)}"},
-            status=500,
+    except ValidationError as e:
+        return json_response(
+            {"success": False, "error": f"Failed to update article: {e.messages[0]}"},
+            status=400,
         )
 
 
@@ -1168,60 +1369,66 @@ def toggle_featured_view(request, article_id):
 def duplicate_article_view(request, article_id):
     """Create a duplicate copy of an article - Protected"""
     try:
-        original_article = get_object_or_404(Article, id=article_id)
-
-        # Create new article with copied data
-        new_article = Article(
-            title=f"{original_article.title} (Copy)",
-            excerpt=original_article.excerpt,
-            category=original_article.category,
-            author=original_article.author,
-            featured_image=original_article.featured_image,
-            status="draft",  # Always create as draft
-            meta_title=original_article.meta_title,
-            meta_description=original_article.meta_description,
-            meta_keywords=original_article.meta_keywords,
-            social_title=original_article.social_title,
-            social_description=original_article.social_description,
-            allow_comments=original_article.allow_comments,
-            created_by=request.user,
-            last_modified_by=request.user,
+        original_article = get_object_or_404(
+            Article.objects.select_related(
+                "category", "author", "featured_image"
+            ).prefetch_related(
+                "tags",
+                Prefetch(
+                    "content_sections",
+                    queryset=ContentSection.objects.only(
+                        "article_id", *SECTION_COPY_FIELDS
+                    ).order_by("order"),
+                    to_attr="ordered_sections",
+                ),
+            ),
+            id=article_id,
         )
-        new_article.save()
-
-        # Copy tags
-        new_article.tags.set(original_article.tags.all())
-
-        # Copy content sections
-        original_sections = original_article.content_sections.all().order_by("order")
-        for section in original_sections:
-            ContentSection.objects.create(
-                article=new_article,
-                section_type=section.section_type,
-                order=section.order,
-                content=section.content,
-                title=section.title,
-                media_file=section.media_file,
-                caption=section.caption,
-                alt_text=section.alt_text,
-                question=section.question,
-                answer=section.answer,
-                interviewer=section.interviewer,
-                interviewee=section.interviewee,
-                list_items=section.list_items,
-                table_data=section.table_data,
-                embed_code=section.embed_code,
-                css_classes=section.css_classes,
-                background_color=section.background_color,
-                is_visible=section.is_visible,
-                is_expandable=section.is_expandable,
+
+        # Copy the article, its tags and its sections in one transaction
+        with transaction.atomic():
+            # Create new article with copied data
+            new_article = Article(
+                title=f"{original_article.title} (Copy)",
+                excerpt=original_article.excerpt,
+                category=original_article.category,
+                author=original_article.author,
+                featured_image=original_article.featured_image,
+                status="draft",  # Always create as draft
+                meta_title=original_article.meta_title,
+                meta_description=original_article.meta_description,
+                meta_keywords=original_article.meta_keywords,
+                social_title=original_article.social_title,
+                social_description=original_article.social_description,
+                allow_comments=original_article.allow_comments,
+                created_by=request.user,
+                last_modified_by=request.user,
+            )
+            new_article.save()
+
+            # Copy tags
+            new_article.tags.set(original_article.tags.all())
+
+            # Copy content sections in a single INSERT
+            ContentSection.objects.bulk_create(
+                [
+                    ContentSection(
+                        article=new_article,
+                        **{
+                            field: getattr(section, field)
+                            for field in SECTION_COPY_FIELDS
+                        },
+                    )
+                    for section in original_article.ordered_sections
+                ],
+                batch_size=500,
             )
 
         logger.info(
             f"Article '{original_article.title}' duplicated by {request.user.username}"
         )
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "message": f"Article duplicated successfully",
@@ -1231,72 +1438,76 @@ def duplicate_article_view(request, article_id):
         )
 
     except Article.DoesNotExist:
-        return JsonResponse(
+        return json_response(
             {"success": False, "error": "Original article not found"}, status=404
         )
-    except Exception as e:
-        logger.error(
-            f"Failed to duplicate article for {request.user.username}: {str(e)}"
+    except IntegrityError:
+        logger.warning(
+            f"Integrity error duplicating article by {request.user.username}"
         )
-        return JsonResponse(
-            {"success": False, "error": f"Failed to duplicate article: {str(e)}"},
-            status=500,
+        return json_response(
+            {
+                "success": False,
+                "error": "Failed to duplicate article: conflicts with existing data",
+            },
+            status=400,
         )
 
 
-@ajax_admin_required
-@require_http_methods(["GET"])
-def dashboard_stats_view(request):
-    """Get dashboard statistics for the home page - Protected"""
-    try:
-        from datetime import datetime, timedelta
-
-        from django.db.models import Count, Q
-
-        # Article statistics
-        total_articles = Article.objects.count()
-        published_articles = Article.objects.filter(status="published").count()
-        draft_articles = Article.objects.filter(status="draft").count()
-        review_articles = Article.objects.filter(status="review").count()
+def _compute_dashboard_stats():
+    """Build the home page statistics served by dashboard_stats_view"""
+    # This month's articles
+    this_month = timezone.localtime().replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
 
-        # This month's articles
-        this_month = datetime.now().replace(day=1)
-        articles_this_month = Article.objects.filter(created_at__gte=this_month).count()
+    # Article statistics and view totals in a single conditional aggregate
+    article_stats = Article.objects.aggregate(
+        total=Count("id"),
+        published=Count("id", filter=Q(status="published")),
+        draft=Count("id", filter=Q(status="draft")),
+        review=Count("id", filter=Q(status="review")),
+        this_month=Count("id", filter=Q(created_at__gte=this_month)),
+        total_views=Sum("view_count"),
+    )
 
-        # Media statistics
-        total_media = CloudinaryMedia.objects.count()
+    # Media statistics
+    total_media = CloudinaryMedia.objects.count()
 
-        # User/subscriber statistics (you might not have these models yet)
-        total_subscribers = 0  # Update when you add newsletter functionality
-        new_subscribers = 0
+    # User/subscriber statistics (you might not have these models yet)
+    total_subscribers = 0  # Update when you add newsletter functionality
+    new_subscribers = 0
 
-        # View statistics (you might want to implement view tracking)
-        total_views = sum(article.view_count for article in Article.objects.all())
+    stats = {
+        "articles": {
+            "total": article_stats["total"],
+            "published": article_stats["published"],
+            "draft": article_stats["draft"],
+            "review": article_stats["review"],
+            "this_month": article_stats["this_month"],
+        },
+        "content": {"total_views": article_stats["total_views"] or 0},
+        "users": {
+            "total_subscribers": total_subscribers,
+            "new_subscribers": new_subscribers,
+        },
+        "media": {"total_files": total_media},
+        "events": {"upcoming": 0},  # Update when you add events functionality
+    }
 
-        stats = {
-            "articles": {
-                "total": total_articles,
-                "published": published_articles,
-                "draft": draft_articles,
-                "review": review_articles,
-                "this_month": articles_this_month,
-            },
-            "content": {"total_views": total_views},
-            "users": {
-                "total_subscribers": total_subscribers,
-                "new_subscribers": new_subscribers,
-            },
-            "media": {"total_files": total_media},
-            "events": {"upcoming": 0},  # Update when you add events functionality
-        }
+    return stats
 
-        return JsonResponse({"success": True, "stats": stats})
 
-    except Exception as e:
-        logger.error(f"Failed to get stats for {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": f"Failed to get stats: {str(e)}"}, status=500
-        )
+@ajax_admin_required
+@require_http_methods(["GET"])
+def dashboard_stats_view(request):
+    """Get dashboard statistics for the home page - Protected"""
+    stats = cache.get_or_set(
+        CacheManager.get_stats_cache_key("dashboard_home"),
+        _compute_dashboard_stats,
+        CacheManager.DASHBOARD_STATS_CACHE_TIMEOUT,
+    )
+    return json_response({"success": True, "stats": stats})
 
 
 @csrf_exempt
@@ -1305,7 +1516,7 @@ def dashboard_stats_view(request):
 def create_category_view(request):
     """Create a new category via AJAX - Protected"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
 
         # Extract and validate data
         name = data.get("name", "").strip().lower()
@@ -1315,7 +1526,7 @@ def create_category_view(request):
 
         # Validate required fields
         if not name or not display_name:
-            return JsonResponse(
+            return json_response(
                 {
                     "success": False,
                     "error": "Category name and display name are required",
@@ -1324,10 +1535,8 @@ def create_category_view(request):
             )
 
         # Validate category name format (only lowercase letters, numbers, underscores)
-        import re
-
-        if not re.match(r"^[a-z0-9_]+$", name):
-            return JsonResponse(
+        if not CATEGORY_NAME_RE.match(name):
+            return json_response(
                 {
                     "success": False,
                     "error": "Category name can only contain lowercase letters, numbers, and underscores",
@@ -1337,15 +1546,20 @@ def create_category_view(request):
 
         # Check if category already exists
         if Category.objects.filter(name=name).exists():
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Category with this name already exists"},
                 status=400,
             )
 
         # Validate color code
-        if not re.match(r"^#[0-9a-fA-F]{6}$", color_code):
+        if not COLOR_CODE_RE.match(color_code):
             color_code = "#dc2626"  # Default color if invalid
 
+        # Next free sort position (MAX is served by the sort_order index)
+        next_sort_order = Category.objects.aggregate(
+            next=Coalesce(Max("sort_order") + 1, 0)
+        )["next"]
+
         # Create category
         category = Category.objects.create(
             name=name,
@@ -1353,12 +1567,12 @@ def create_category_view(request):
             description=description,
             color_code=color_code,
             is_active=True,
-            sort_order=Category.objects.count(),  # Add at end
+            sort_order=next_sort_order,  # Add at end
         )
 
         logger.info(f"Category '{display_name}' created by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "message": "Category created successfully",
@@ -1371,15 +1585,14 @@ def create_category_view(request):
             }
         )
 
-    except json.JSONDecodeError:
-        return JsonResponse(
+    except orjson.JSONDecodeError:
+        return json_response(
             {"success": False, "error": "Invalid JSON data"}, status=400
         )
-    except Exception as e:
-        logger.error(f"Error creating category by {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": "An error occurred while creating category"},
-            status=500,
+    except IntegrityError:
+        return json_response(
+            {"success": False, "error": "Category with this name already exists"},
+            status=400,
         )
 
 
@@ -1389,7 +1602,7 @@ def create_category_view(request):
 def create_author_view(request):
     """Create a new author via AJAX - Protected"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
 
         # Extract and validate data
         name = data.get("name", "").strip()
@@ -1399,13 +1612,20 @@ def create_author_view(request):
 
         # Validate required fields
         if not name:
-            return JsonResponse(
+            return json_response(
                 {"success": False, "error": "Author name is required"}, status=400
             )
 
-        # Check if author already exists
-        if Author.objects.filter(name=name).exists():
-            return JsonResponse(
+        # Check if author name or email already exists in a single query
+        duplicate_filter = Q(name=name)
+        if email:
+            duplicate_filter |= Q(email=email)
+        duplicates = list(
+            Author.objects.filter(duplicate_filter).values_list("name", "email")
+        )
+
+        if any(existing_name == name for existing_name, _ in duplicates):
+            return json_response(
                 {"success": False, "error": "Author with this name already exists"},
                 status=400,
             )
@@ -1414,20 +1634,25 @@ def create_author_view(request):
         if email:
             try:
                 validate_email(email)
-                # Check if email already exists
-                if Author.objects.filter(email=email).exists():
-                    return JsonResponse(
-                        {
-                            "success": False,
-                            "error": "Author with this email already exists",
-                        },
-                        status=400,
-                    )
             except ValidationError:
-                return JsonResponse(
+                return json_response(
                     {"success": False, "error": "Invalid email address"}, status=400
                 )
 
+            if duplicates:
+                return json_response(
+                    {
+                        "success": False,
+                        "error": "Author with this email already exists",
+                    },
+                    status=400,
+                )
+
+        # Next free sort position (MAX is served by the sort_order index)
+        next_sort_order = Author.objects.aggregate(
+            next=Coalesce(Max("sort_order") + 1, 0)
+        )["next"]
+
         # Create author
         author = Author.objects.create(
             name=name,
@@ -1435,12 +1660,12 @@ def create_author_view(request):
             email=email,
             bio=bio,
             is_active=True,
-            sort_order=Author.objects.count(),  # Add at end
+            sort_order=next_sort_order,  # Add at end
         )
 
         logger.info(f"Author '{name}' created by {request.user.username}")
 
-        return JsonResponse(
+        return json_response(
             {
                 "success": True,
                 "message": "Author created successfully",
@@ -1453,13 +1678,12 @@ def create_author_view(request):
             }
         )
 
-    except json.JSONDecodeError:
-        return JsonResponse(
+    except orjson.JSONDecodeError:
+        return json_response(
             {"success": False, "error": "Invalid JSON data"}, status=400
         )
-    except Exception as e:
-        logger.error(f"Error creating author by {request.user.username}: {str(e)}")
-        return JsonResponse(
-            {"success": False, "error": "An error occurred while creating author"},
-            status=500,
+    except IntegrityError:
+        return json_response(
+            {"success": False, "error": "Author with this name already exists"},
+            status=400,
         )
@@ -1,7 +1,9 @@
 from datetime import timedelta
 
 from django.contrib import admin
-from django.db.models import Avg, Count
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.db.models import Avg, Count, Exists, OuterRef
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.html import format_html
@@ -20,6 +22,14 @@ from tpsq.models import (
 )
 
 
+class ProjectedChangeList(ChangeList):
+    """Changelist that only selects the model admin's list_only columns"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.list_only)
+
+
 @admin.register(UserSession)
 class UserSessionAdmin(admin.ModelAdmin):
     list_display = [
@@ -33,6 +43,18 @@ class UserSessionAdmin(admin.ModelAdmin):
         "is_bounce",
         "has_signup",
     ]
+    # Columns loaded for the changelist; the change form still loads them all
+    list_only = [
+        "id",
+        "session_id",
+        "first_seen",
+        "device_type",
+        "browser",
+        "utm_source",
+        "page_views",
+        "time_on_site",
+        "is_bounce",
+    ]
     list_filter = [
         "device_type",
         "browser",
@@ -99,6 +121,21 @@ class UserSessionAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+
+    def get_queryset(self, request):
+        """Annotate signup existence so has_signup needs no per-row query"""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                signup_exists=Exists(
+                    EarlyAccessSignup.objects.filter(session_id=OuterRef("pk"))
+                )
+            )
+        )
+
     def session_display(self, obj):
         """Display short session ID"""
         return f"{str(obj.session_id)[:8]}..."
@@ -115,10 +152,11 @@ class UserSessionAdmin(admin.ModelAdmin):
 
     def has_signup(self, obj):
         """Show if session resulted in signup"""
-        return hasattr(obj, "signup")
+        return obj.signup_exists
 
     has_signup.short_description = "Converted"
     has_signup.boolean = True
+    has_signup.admin_order_field = "signup_exists"
 
 
 @admin.register(FunnelEvent)
@@ -131,7 +169,20 @@ class FunnelEventAdmin(admin.ModelAdmin):
         "time_since_load",
         "element_id",
     ]
+    # Columns loaded for the changelist; skips metadata, page_url and the
+    # session's wide columns
+    list_only = [
+        "id",
+        "timestamp",
+        "session__id",
+        "session__session_id",
+        "event_type",
+        "page_title",
+        "time_since_page_load",
+        "element_id",
+    ]
     list_filter = ["event_type", "timestamp"]
+    list_select_related = ["session"]
     search_fields = ["session__session_id", "page_url", "page_title", "element_id"]
     readonly_fields = ["timestamp"]
     date_hierarchy = "timestamp"
@@ -149,6 +200,9 @@ class FunnelEventAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+
     def session_short(self, obj):
         """Display short session ID with link"""
         session_id = str(obj.session.session_id)[:8]
@@ -193,6 +247,7 @@ class SurveyResponseAdmin(admin.ModelAdmin):
             admin.ChoicesFieldListFilter,
         ),  # Better filtering for preferences
     ]
+    list_select_related = ["session"]
     search_fields = ["session__session_id"]
     readonly_fields = ["created_at", "engagement_level", "question_type"]
     date_hierarchy = "created_at"
@@ -456,10 +511,26 @@ class DailyStatsAdmin(admin.ModelAdmin):
 
     def recalculate_rates(self, request, queryset):
         """Admin action to recalculate conversion rates"""
-        count = 0
-        for stats in queryset:
-            stats.calculate_rates()
-            count += 1
+        stats_list = list(queryset)
+
+        # Bounce counts for every selected day in one grouped query
+        bounce_counts = dict(
+            UserSession.objects.filter(
+                is_bounce=True,
+                first_seen__date__in=[stats.date for stats in stats_list],
+            )
+            .values_list("first_seen__date")
+            .annotate(count=Count("pk"))
+        )
+
+        for stats in stats_list:
+            stats.calculate_rates(
+                save=False, bounce_sessions=bounce_counts.get(stats.date, 0)
+            )
+        DailyStats.objects.bulk_update(
+            stats_list, DailyStats.RATE_FIELDS, batch_size=500
+        )
+        count = len(stats_list)
 
         self.message_user(
             request, f"Recalculated rates for {count} daily stats records."
@@ -549,14 +620,22 @@ class AnalyticsAdminMixin:
             week_ago = timezone.now() - timedelta(days=7)
 
             if hasattr(self.model, "created_at"):
-                recent_count = self.model.objects.filter(
-                    created_at__gte=week_ago
-                ).count()
-                extra_context["recent_count"] = recent_count
+                date_field = "created_at"
             elif hasattr(self.model, "first_seen"):
-                recent_count = self.model.objects.filter(
-                    first_seen__gte=week_ago
-                ).count()
+                date_field = "first_seen"
+            else:
+                date_field = None
+
+            if date_field:
+                # Cache the count briefly; it is recomputed on every changelist
+                # page load otherwise
+                cache_key = f"admin_recent_{self.model._meta.label}_{week_ago.date()}"
+                recent_count = cache.get(cache_key)
+                if recent_count is None:
+                    recent_count = self.model.objects.filter(
+                        **{f"{date_field}__gte": week_ago}
+                    ).count()
+                    cache.set(cache_key, recent_count, 300)
                 extra_context["recent_count"] = recent_count
 
         return super().changelist_view(request, extra_context=extra_context)
@@ -6,12 +6,14 @@ Usage:
     python manage.py compute_daily_stats --date 2024-01-15
     python manage.py compute_daily_stats --days 7
     python manage.py compute_daily_stats --backfill
+    python manage.py compute_daily_stats --backfill --workers 8
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connections, transaction
 from django.db.models import Avg, Count, Q
 from django.utils import timezone
 from tpsq.models import (
@@ -48,10 +50,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Force recomputation even if stats already exist",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of days to compute in parallel when backfilling (default: 1)",
+        )
 
     def handle(self, *args, **options):
         if options["backfill"]:
-            self.backfill_all_stats(options["force"])
+            self.backfill_all_stats(options["force"], options["workers"])
         elif options["date"]:
             try:
                 target_date = datetime.strptime(options["date"], "%Y-%m-%d").date()
@@ -67,7 +75,7 @@ class Command(BaseCommand):
                 target_date = start_date + timedelta(days=i)
                 self.compute_stats_for_date(target_date, options["force"])
 
-    def backfill_all_stats(self, force=False):
+    def backfill_all_stats(self, force=False, workers=1):
         """Backfill stats for all dates since the first session"""
         self.stdout.write("Starting backfill process...")
 
@@ -87,16 +95,29 @@ class Command(BaseCommand):
             f"Backfilling {total_days} days from {start_date} to {end_date}"
         )
 
-        computed_count = 0
-        skipped_count = 0
+        dates = [start_date + timedelta(days=i) for i in range(total_days)]
+
+        # Each day is independent, so split the range across worker threads;
+        # every worker handles a contiguous slice on its own DB connection
+        workers = max(1, min(workers, total_days))
+        if workers == 1:
+            results = self.compute_stats_for_dates(dates, force)
+        else:
+            slice_size = -(-total_days // workers)
+            slices = [
+                dates[i : i + slice_size] for i in range(0, total_days, slice_size)
+            ]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = [
+                    result
+                    for slice_results in executor.map(
+                        self.compute_stats_in_thread, slices, [force] * len(slices)
+                    )
+                    for result in slice_results
+                ]
 
-        current_date = start_date
-        while current_date <= end_date:
-            if self.compute_stats_for_date(current_date, force, quiet=True):
-                computed_count += 1
-            else:
-                skipped_count += 1
-            current_date += timedelta(days=1)
+        computed_count = sum(results)
+        skipped_count = len(results) - computed_count
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -104,6 +125,22 @@ class Command(BaseCommand):
             )
         )
 
+    def compute_stats_for_dates(self, dates, force=False):
+        """Quietly compute stats for each date, returning one result per date"""
+        return [
+            self.compute_stats_for_date(target_date, force, quiet=True)
+            for target_date in dates
+        ]
+
+    def compute_stats_in_thread(self, dates, force=False):
+        """Run compute_stats_for_dates in a worker thread"""
+        try:
+            return self.compute_stats_for_dates(dates, force)
+        finally:
+            # Django opens one connection per thread; close this worker's
+            # connection so it isn't left open after the thread exits
+            connections.close_all()
+
     def compute_stats_for_date(self, target_date, force=False, quiet=False):
         """Compute stats for a specific date"""
 
@@ -127,9 +164,6 @@ class Command(BaseCommand):
                     date=target_date, defaults=stats
                 )
 
-                # Calculate conversion rates
-                daily_stats.calculate_rates()
-
                 action = "Created" if created else "Updated"
                 if not quiet:
                     self.stdout.write(
@@ -152,28 +186,36 @@ class Command(BaseCommand):
     def calculate_daily_metrics(self, target_date):
         """Calculate all metrics for a given date"""
 
-        # Date range for filtering
-        start_datetime = datetime.combine(target_date, datetime.min.time())
-        end_datetime = datetime.combine(target_date, datetime.max.time())
+        # Half-open [start, end) range so filters compare the raw indexed
+        # columns instead of casting them with __date
+        start_datetime = timezone.make_aware(
+            datetime.combine(target_date, datetime.min.time())
+        )
+        end_datetime = start_datetime + timedelta(days=1)
 
         # Sessions for this date
-        sessions = UserSession.objects.filter(first_seen__date=target_date)
+        sessions = UserSession.objects.filter(
+            first_seen__gte=start_datetime, first_seen__lt=end_datetime
+        )
 
         # Events for this date
         events = FunnelEvent.objects.filter(
-            timestamp__range=[start_datetime, end_datetime]
+            timestamp__gte=start_datetime, timestamp__lt=end_datetime
         )
 
         # Survey responses for this date
-        surveys = SurveyResponse.objects.filter(created_at__date=target_date)
+        surveys = SurveyResponse.objects.filter(
+            created_at__gte=start_datetime, created_at__lt=end_datetime
+        )
 
         # Signups for this date
-        signups = EarlyAccessSignup.objects.filter(created_at__date=target_date)
+        signups = EarlyAccessSignup.objects.filter(
+            created_at__gte=start_datetime, created_at__lt=end_datetime
+        )
 
-        # Count events by type
-        event_counts = {}
-        for event_type, _ in FunnelEvent.EVENT_TYPES:
-            event_counts[event_type] = events.filter(event_type=event_type).count()
+        # Count events by type in a single GROUP BY
+        type_counts = events.values("event_type").annotate(count=Count("pk"))
+        event_counts = {item["event_type"]: item["count"] for item in type_counts}
 
         # Survey preference breakdown
         preference_counts = surveys.values("preference").annotate(count=Count("pk"))
@@ -181,8 +223,9 @@ class Command(BaseCommand):
             item["preference"]: item["count"] for item in preference_counts
         }
 
-        # Session quality metrics
+        # Session count and quality metrics
         session_metrics = sessions.aggregate(
+            visitors=Count("id"),
             avg_time=Avg("time_on_site"),
             bounce_sessions=Count("id", filter=Q(is_bounce=True)),
         )
@@ -190,16 +233,22 @@ class Command(BaseCommand):
         avg_time_minutes = (session_metrics["avg_time"] or 0) / 60
         bounce_count = session_metrics["bounce_sessions"] or 0
 
-        return {
+        # Signup totals
+        signup_metrics = signups.aggregate(
+            total=Count("id"),
+            verified=Count("id", filter=Q(is_verified=True)),
+        )
+
+        metrics = {
             # Funnel metrics
             "ad_impressions": event_counts.get("ad_impression", 0),
             "ad_clicks": event_counts.get("ad_click", 0),
             "page_views": event_counts.get("page_view", 0),
-            "unique_visitors": sessions.count(),
+            "unique_visitors": session_metrics["visitors"],
             "surveys_started": event_counts.get("survey_start", 0),
             "surveys_completed": event_counts.get("survey_complete", 0),
-            "signups": signups.count(),
-            "verified_signups": signups.filter(is_verified=True).count(),
+            "signups": signup_metrics["total"],
+            "verified_signups": signup_metrics["verified"],
             # Survey preferences
             "prefer_nothing": preference_breakdown.get("nothing", 0),
             "prefer_notification": preference_breakdown.get("notification", 0),
@@ -208,6 +257,14 @@ class Command(BaseCommand):
             "avg_time_on_site": round(avg_time_minutes, 1),
         }
 
+        # Conversion rates from the counts above, so the record is written once
+        rates = DailyStats(date=target_date, **metrics)
+        rates.calculate_rates(save=False, bounce_sessions=bounce_count)
+        for field in DailyStats.RATE_FIELDS:
+            metrics[field] = getattr(rates, field)
+
+        return metrics
+
     def get_date_range_display(self, start_date, end_date):
         """Helper to format date range for display"""
         if start_date == end_date:
@@ -12,20 +12,26 @@ from tpsq.models import (
     PretotypeSession,
 )
 
+# Rows per INSERT when bulk-creating sample data
+BATCH_SIZE = 1000
+
 
 class Command(BaseCommand):
     help = "Create sample data for pretotype feed"
 
     def handle(self, *args, **options):
         # Create sample sessions
-        sessions = []
-        for i in range(20):
-            session = PretotypeSession.objects.create(
-                session_id=uuid.uuid4(),
-                device_type=random.choice(["mobile", "desktop", "tablet"]),
-                started_at=timezone.now() - timedelta(days=random.randint(0, 30)),
-            )
-            sessions.append(session)
+        sessions = PretotypeSession.objects.bulk_create(
+            [
+                PretotypeSession(
+                    session_id=uuid.uuid4(),
+                    device_type=random.choice(["mobile", "desktop", "tablet"]),
+                    started_at=timezone.now() - timedelta(days=random.randint(0, 30)),
+                )
+                for i in range(20)
+            ],
+            batch_size=BATCH_SIZE,
+        )
 
         # Create sample issues
         issue_types = [
@@ -49,7 +55,7 @@ class Command(BaseCommand):
 
         issues = []
         for i, session in enumerate(sessions[:15]):  # Create 15 sample issues
-            issue = PretotypeIssue.objects.create(
+            issue = PretotypeIssue(
                 session=session,
                 issue_type=random.choice(issue_types),
                 issue_details=random.choice(sample_descriptions),
@@ -57,7 +63,10 @@ class Command(BaseCommand):
                 + timedelta(minutes=random.randint(5, 30)),
                 time_to_submit=random.randint(30, 300),
             )
+            # bulk_create() skips save(), which normally fills these in
+            issue.set_derived_fields()
             issues.append(issue)
+        PretotypeIssue.objects.bulk_create(issues, batch_size=BATCH_SIZE)
 
         # Create sample comments
         sample_comments = [
@@ -71,18 +80,25 @@ class Command(BaseCommand):
             "Update: Work has begun on addressing this issue.",
         ]
 
+        # Display names for citizen commenters, formatted once per session
+        citizen_names = {
+            session.session_id: f"Citizen {str(session.session_id)[:8]}"
+            for session in sessions
+        }
+
+        comments = []
         for issue in issues[:10]:  # Add comments to first 10 issues
             num_comments = random.randint(1, 5)
             for j in range(num_comments):
                 commenter_session = random.choice(sessions)
                 is_govt = random.random() < 0.1  # 10% chance of government response
 
-                PretotypeComment.objects.create(
+                comment = PretotypeComment(
                     issue=issue,
                     session=commenter_session,
                     content=random.choice(sample_comments),
                     commenter_name=(
-                        f"Citizen {str(commenter_session.session_id)[:8]}"
+                        citizen_names[commenter_session.session_id]
                         if not is_govt
                         else "Lagos State Ministry"
                     ),
@@ -91,21 +107,24 @@ class Command(BaseCommand):
                     created_at=issue.submitted_at
                     + timedelta(hours=random.randint(1, 48)),
                 )
+                comments.append(comment)
+        PretotypeComment.objects.bulk_create(comments, batch_size=BATCH_SIZE)
 
         # Create sample reactions
         reaction_types = ["like", "support", "me_too", "heart", "angry", "sad"]
+        reactions = []
         for issue in issues:
             num_reactions = random.randint(2, 15)
             reacting_sessions = random.sample(
                 sessions, min(num_reactions, len(sessions))
             )
 
-            for session in reacting_sessions:
-                PretotypeReaction.objects.create(
-                    issue=issue,
-                    session=session,
-                    reaction_type=random.choice(reaction_types),
-                )
+            chosen_types = random.choices(reaction_types, k=len(reacting_sessions))
+            reactions.extend(
+                PretotypeReaction(issue=issue, session=session, reaction_type=reaction)
+                for session, reaction in zip(reacting_sessions, chosen_types)
+            )
+        PretotypeReaction.objects.bulk_create(reactions, batch_size=BATCH_SIZE)
 
         # Create some status updates
         status_types = [
@@ -115,15 +134,20 @@ class Command(BaseCommand):
             "in_progress",
             "resolved",
         ]
+        status_updates = []
         for issue in random.sample(issues, 8):  # Update status for 8 issues
             status = random.choice(status_types[1:])  # Don't use 'reported'
-            PretotypeIssueStatus.objects.create(
-                issue=issue,
-                status=status,
-                message=f"Status update: Issue is now {status.replace('_', ' ')}.",
-                updated_by="Lagos State Government",
-                created_at=issue.submitted_at + timedelta(days=random.randint(1, 7)),
+            status_updates.append(
+                PretotypeIssueStatus(
+                    issue=issue,
+                    status=status,
+                    message=f"Status update: Issue is now {status.replace('_', ' ')}.",
+                    updated_by="Lagos State Government",
+                    created_at=issue.submitted_at
+                    + timedelta(days=random.randint(1, 7)),
+                )
             )
+        PretotypeIssueStatus.objects.bulk_create(status_updates, batch_size=BATCH_SIZE)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -17,7 +17,7 @@ from datetime import datetime, timedelta
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.utils import timezone
 from tpsq.models import (
     DailyStats,
@@ -27,6 +27,48 @@ from tpsq.models import (
     UserSession,
 )
 
+# Rows per INSERT when bulk-creating test data
+BATCH_SIZE = 1000
+
+# Relative session volume per hour of day; peaks 9-11 AM, 2-4 PM, 7-9 PM
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 3, 4, 5, 8, 7, 6, 4, 5, 8, 7, 5, 4, 6, 8, 6, 4, 2, 1]
+
+# Fixed pools the random_* helpers pick from
+SIGNUP_NAMES = (
+    "John Doe",
+    "Jane Smith",
+    "Ahmed Hassan",
+    "Fatima Yusuf",
+    "Kemi Adebayo",
+    "Chidi Okafor",
+    "Aisha Ibrahim",
+    "Tunde Williams",
+    "Grace Ogundimu",
+    "Ibrahim Musa",
+)
+MOBILE_USER_AGENTS = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15",
+    "Mozilla/5.0 (Android 11; Mobile; rv:91.0) Gecko/91.0 Firefox/91.0",
+    "Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36",
+)
+TABLET_USER_AGENT = "Mozilla/5.0 (iPad; CPU OS 15_0 like Mac OS X) AppleWebKit/605.1.15"
+DESKTOP_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+)
+REFERRERS = {
+    "google": "https://www.google.com/",
+    "facebook": "https://www.facebook.com/",
+    "twitter": "https://twitter.com/",
+    "linkedin": "https://www.linkedin.com/",
+    "": "",  # Direct traffic
+}
+BROWSERS = ("Chrome", "Safari", "Firefox", "Edge", "Opera")
+MOBILE_OSES = ("iOS", "Android")
+TABLET_OSES = ("iOS", "Android", "iPadOS")
+DESKTOP_OSES = ("Windows", "macOS", "Linux")
+
 
 class Command(BaseCommand):
     help = "Create test analytics data with mixed old and new preferences"
@@ -74,11 +116,11 @@ class Command(BaseCommand):
         """Clear existing test data"""
         self.stdout.write("🗑️  Clearing existing test data...")
 
-        # Delete in order to respect foreign key constraints
+        # Signups go out as a single DELETE. Deleting the sessions cascades to
+        # their funnel events and survey responses in one statement each, so
+        # the collector only needs the session primary keys
         EarlyAccessSignup.objects.filter(email__contains="testuser").delete()
-        FunnelEvent.objects.filter(session__utm_campaign__contains="test").delete()
-        SurveyResponse.objects.filter(session__utm_campaign__contains="test").delete()
-        UserSession.objects.filter(utm_campaign__contains="test").delete()
+        UserSession.objects.filter(utm_campaign__contains="test").only("pk").delete()
         DailyStats.objects.filter(
             date__gte=timezone.now().date() - timedelta(days=30)
         ).delete()
@@ -141,20 +183,32 @@ class Command(BaseCommand):
             {"preference": "no_wouldnt_use", "weight": 10},
         ]
 
+        # One base timestamp per day, oldest first, from a single clock read
+        now = timezone.now()
+        base_dates = [now - timedelta(days=days - i - 1) for i in range(days)]
+
+        # Conversion settings by traffic source, for the per-session lookup
+        source_map = {source["utm_source"]: source for source in traffic_sources}
+
         # Generate sessions distributed over days
-        sessions_per_day = self.distribute_sessions_over_days(total_sessions, days)
+        sessions_per_day = self.distribute_sessions_over_days(
+            total_sessions, base_dates
+        )
 
         total_created = 0
+        day_totals = []
         for day_offset in range(days):
             day_sessions = sessions_per_day[day_offset]
-            base_date = timezone.now() - timedelta(days=days - day_offset - 1)
+            base_date = base_dates[day_offset]
 
             self.stdout.write(
                 f"📅 Day {day_offset + 1}: Creating {day_sessions} sessions..."
             )
 
-            day_signups = 0
-            day_surveys = 0
+            day_session_list = []
+            day_events = []
+            day_survey_list = []
+            day_signup_list = []
 
             for _ in range(day_sessions):
                 # Create session with realistic timing throughout the day
@@ -162,31 +216,27 @@ class Command(BaseCommand):
                 session = self.create_session(
                     session_time, traffic_sources, device_types
                 )
+                day_session_list.append(session)
 
-                # Create funnel events with realistic progression
-                events = self.create_funnel_events(session, session_time)
+                # Build funnel events with realistic progression
+                day_events.extend(self.create_funnel_events(session, session_time))
 
                 # Determine if user completes survey (70% completion rate)
                 if random.random() < 0.70:
                     preference = self.weighted_choice(preference_distribution)
-                    survey = self.create_survey_response(
-                        session, preference, session_time
+                    day_survey_list.append(
+                        self.create_survey_response(session, preference, session_time)
                     )
-                    day_surveys += 1
 
                     # Determine if user converts (varies by traffic source)
-                    source_config = next(
-                        (
-                            s
-                            for s in traffic_sources
-                            if s["utm_source"] == session.utm_source
-                        ),
-                        traffic_sources[-1],
+                    source_config = source_map.get(
+                        session.utm_source, traffic_sources[-1]
                     )
 
                     if random.random() < source_config["conversion_rate"]:
-                        signup = self.create_signup(session, session_time)
-                        day_signups += 1
+                        day_signup_list.append(
+                            self.create_signup(session, session_time)
+                        )
 
                 total_created += 1
 
@@ -195,31 +245,45 @@ class Command(BaseCommand):
                         f"   Created {total_created}/{total_sessions} sessions..."
                     )
 
-            # Create daily stats for this day
-            self.create_daily_stats(
-                base_date.date(), day_sessions, day_surveys, day_signups
+            # Insert the day's rows in batches; sessions first so the
+            # dependent rows pick up their primary keys
+            UserSession.objects.bulk_create(day_session_list, batch_size=BATCH_SIZE)
+            FunnelEvent.objects.bulk_create(day_events, batch_size=BATCH_SIZE)
+            SurveyResponse.objects.bulk_create(day_survey_list, batch_size=BATCH_SIZE)
+            EarlyAccessSignup.objects.bulk_create(
+                day_signup_list, batch_size=BATCH_SIZE
+            )
+
+            day_totals.append(
+                (
+                    base_date.date(),
+                    day_sessions,
+                    len(day_survey_list),
+                    len(day_signup_list),
+                )
             )
 
+        # Create daily stats for all days at once
+        self.create_daily_stats(day_totals)
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"✅ Created {total_created} sessions with realistic funnel progression"
             )
         )
 
-    def distribute_sessions_over_days(self, total_sessions, days):
+    def distribute_sessions_over_days(self, total_sessions, base_dates):
         """Distribute sessions over days with realistic patterns"""
         # Higher traffic on recent days, lower on weekends
         base_distribution = []
+        days = len(base_dates)
 
-        for day_offset in range(days):
+        for day_offset, base_date in enumerate(base_dates):
             # Recent days get more traffic
             recency_multiplier = 0.7 + (day_offset / days) * 0.6
 
-            # Weekend effect (assuming day 0 is most recent)
-            day_of_week = (
-                timezone.now() - timedelta(days=days - day_offset - 1)
-            ).weekday()
-            weekend_multiplier = 0.6 if day_of_week >= 5 else 1.0
+            # Weekend effect
+            weekend_multiplier = 0.6 if base_date.weekday() >= 5 else 1.0
 
             weight = recency_multiplier * weekend_multiplier
             base_distribution.append(weight)
@@ -243,36 +307,7 @@ class Command(BaseCommand):
 
     def random_time_in_day(self, base_date):
         """Generate random time within a day with realistic distribution"""
-        # Peak hours: 9-11 AM, 2-4 PM, 7-9 PM
-        hour_weights = [
-            1,
-            1,
-            1,
-            1,
-            1,
-            2,
-            3,
-            4,
-            5,
-            8,
-            7,
-            6,
-            4,
-            5,
-            8,
-            7,
-            5,
-            4,
-            6,
-            8,
-            6,
-            4,
-            2,
-            1,
-        ]
-        hour = self.weighted_choice(
-            [{"preference": i, "weight": w} for i, w in enumerate(hour_weights)]
-        )
+        hour = random.choices(range(24), weights=HOUR_WEIGHTS)[0]
 
         minute = random.randint(0, 59)
         second = random.randint(0, 59)
@@ -280,13 +315,13 @@ class Command(BaseCommand):
         return base_date.replace(hour=hour, minute=minute, second=second)
 
     def create_session(self, session_time, traffic_sources, device_types):
-        """Create a realistic user session"""
+        """Build a realistic, unsaved user session"""
         # Select traffic source and device
         source_config = self.weighted_choice(traffic_sources)
         device_config = self.weighted_choice(device_types)
 
         # Generate realistic session data
-        session = UserSession.objects.create(
+        session = UserSession(
             session_id=uuid.uuid4(),
             first_seen=session_time,
             last_activity=session_time + timedelta(minutes=random.randint(1, 15)),
@@ -316,13 +351,13 @@ class Command(BaseCommand):
         return session
 
     def create_funnel_events(self, session, session_time):
-        """Create realistic funnel events for a session"""
+        """Build realistic, unsaved funnel events for a session"""
         events = []
         current_time = session_time
 
         # Always start with page view
         events.append(
-            FunnelEvent.objects.create(
+            FunnelEvent(
                 session=session,
                 event_type="page_view",
                 timestamp=current_time,
@@ -338,7 +373,7 @@ class Command(BaseCommand):
         # 70% start survey
         if random.random() < 0.70:
             events.append(
-                FunnelEvent.objects.create(
+                FunnelEvent(
                     session=session,
                     event_type="survey_start",
                     timestamp=current_time,
@@ -353,7 +388,7 @@ class Command(BaseCommand):
             # 85% complete survey if they started
             if random.random() < 0.85:
                 events.append(
-                    FunnelEvent.objects.create(
+                    FunnelEvent(
                         session=session,
                         event_type="survey_complete",
                         timestamp=current_time,
@@ -370,7 +405,7 @@ class Command(BaseCommand):
                 # 60% proceed to form if they completed survey
                 if random.random() < 0.60:
                     events.append(
-                        FunnelEvent.objects.create(
+                        FunnelEvent(
                             session=session,
                             event_type="form_start",
                             timestamp=current_time,
@@ -384,7 +419,7 @@ class Command(BaseCommand):
                     # 80% complete signup if they started form
                     if random.random() < 0.80:
                         events.append(
-                            FunnelEvent.objects.create(
+                            FunnelEvent(
                                 session=session,
                                 event_type="signup_attempt",
                                 timestamp=current_time,
@@ -398,7 +433,7 @@ class Command(BaseCommand):
                         # 90% succeed if they attempted
                         if random.random() < 0.90:
                             events.append(
-                                FunnelEvent.objects.create(
+                                FunnelEvent(
                                     session=session,
                                     event_type="signup_success",
                                     timestamp=current_time,
@@ -410,7 +445,7 @@ class Command(BaseCommand):
         # Always add page exit
         exit_time = current_time + timedelta(seconds=random.randint(1, 30))
         events.append(
-            FunnelEvent.objects.create(
+            FunnelEvent(
                 session=session,
                 event_type="page_exit",
                 timestamp=exit_time,
@@ -422,8 +457,8 @@ class Command(BaseCommand):
         return events
 
     def create_survey_response(self, session, preference, session_time):
-        """Create survey response with realistic timing"""
-        return SurveyResponse.objects.create(
+        """Build an unsaved survey response with realistic timing"""
+        return SurveyResponse(
             session=session,
             preference=preference,
             created_at=session_time + timedelta(seconds=random.randint(10, 90)),
@@ -432,25 +467,12 @@ class Command(BaseCommand):
         )
 
     def create_signup(self, session, session_time):
-        """Create early access signup"""
+        """Build an unsaved early access signup"""
         user_number = random.randint(1000, 9999)
-        names = [
-            "John Doe",
-            "Jane Smith",
-            "Ahmed Hassan",
-            "Fatima Yusuf",
-            "Kemi Adebayo",
-            "Chidi Okafor",
-            "Aisha Ibrahim",
-            "Tunde Williams",
-            "Grace Ogundimu",
-            "Ibrahim Musa",
-        ]
-
-        name = random.choice(names)
+        name = random.choice(SIGNUP_NAMES)
         email = f"testuser{user_number}@example.com"
 
-        return EarlyAccessSignup.objects.create(
+        return EarlyAccessSignup(
             session=session,
             name=name,
             email=email,
@@ -465,54 +487,108 @@ class Command(BaseCommand):
             ),
         )
 
-    def create_daily_stats(self, date, sessions, surveys, signups):
-        """Create or update daily stats for a date"""
-        events_for_day = FunnelEvent.objects.filter(timestamp__date=date)
-
-        stats, created = DailyStats.objects.get_or_create(
-            date=date,
-            defaults={
-                "unique_visitors": sessions,
-                "page_views": events_for_day.filter(event_type="page_view").count(),
-                "surveys_started": events_for_day.filter(
-                    event_type="survey_start"
-                ).count(),
-                "surveys_completed": events_for_day.filter(
-                    event_type="survey_complete"
-                ).count(),
-                "signups": signups,
-                "verified_signups": int(signups * 0.75),
-            },
+    def create_daily_stats(self, day_totals):
+        """
+        Create or update daily stats from (date, sessions, surveys, signups)
+        tuples, upserting every day in a single statement.
+        """
+        dates = [date for date, _, _, _ in day_totals]
+
+        # The days are consecutive, so filter on one half-open [start, end)
+        # range that can use the timestamp indexes instead of casting the
+        # columns with __date; only the grouping needs the date
+        start_datetime = timezone.make_aware(
+            datetime.combine(min(dates), datetime.min.time())
+        )
+        end_datetime = timezone.make_aware(
+            datetime.combine(max(dates) + timedelta(days=1), datetime.min.time())
+        )
+
+        # Event and bounce counts for every day, grouped by date
+        event_counts = {
+            row["timestamp__date"]: row
+            for row in FunnelEvent.objects.filter(
+                timestamp__gte=start_datetime, timestamp__lt=end_datetime
+            )
+            .values("timestamp__date")
+            .annotate(
+                page_views=Count("id", filter=Q(event_type="page_view")),
+                surveys_started=Count("id", filter=Q(event_type="survey_start")),
+                surveys_completed=Count("id", filter=Q(event_type="survey_complete")),
+            )
+        }
+        bounce_counts = dict(
+            UserSession.objects.filter(
+                first_seen__gte=start_datetime,
+                first_seen__lt=end_datetime,
+                is_bounce=True,
+            )
+            .values("first_seen__date")
+            .annotate(count=Count("id"))
+            .values_list("first_seen__date", "count")
         )
+        existing = {
+            stats.date: stats
+            for stats in DailyStats.objects.filter(date__in=dates).only(
+                "date",
+                "unique_visitors",
+                "signups",
+                "ad_impressions",
+                "ad_clicks",
+                *DailyStats.RATE_FIELDS,
+            )
+        }
 
-        if not created:
-            # Update existing stats
-            stats.unique_visitors += sessions
-            stats.page_views = events_for_day.filter(event_type="page_view").count()
-            stats.surveys_started = events_for_day.filter(
-                event_type="survey_start"
-            ).count()
-            stats.surveys_completed = events_for_day.filter(
-                event_type="survey_complete"
-            ).count()
-            stats.signups += signups
-            stats.verified_signups = int(stats.signups * 0.75)
-
-        stats.calculate_rates()
+        stats_list = []
+        for date, sessions, surveys, signups in day_totals:
+            counts = event_counts.get(date, {})
+            previous = existing.get(date)
+            if previous:
+                # Add to the existing day's totals
+                sessions += previous.unique_visitors
+                signups += previous.signups
+
+            stats = DailyStats(
+                date=date,
+                unique_visitors=sessions,
+                page_views=counts.get("page_views", 0),
+                surveys_started=counts.get("surveys_started", 0),
+                surveys_completed=counts.get("surveys_completed", 0),
+                signups=signups,
+                verified_signups=int(signups * 0.75),
+            )
+            if previous:
+                # Keep the ad counts and any rate calculate_rates() won't redo
+                stats.ad_impressions = previous.ad_impressions
+                stats.ad_clicks = previous.ad_clicks
+                for field in DailyStats.RATE_FIELDS:
+                    setattr(stats, field, getattr(previous, field))
+            stats.calculate_rates(
+                save=False, bounce_sessions=bounce_counts.get(date, 0)
+            )
+            stats_list.append(stats)
+
+        DailyStats.objects.bulk_create(
+            stats_list,
+            update_conflicts=True,
+            unique_fields=["date"],
+            update_fields=[
+                "unique_visitors",
+                "page_views",
+                "surveys_started",
+                "surveys_completed",
+                "signups",
+                "verified_signups",
+                *DailyStats.RATE_FIELDS,
+                "updated_at",
+            ],
+        )
 
     # Helper methods for realistic data generation
     def weighted_choice(self, choices):
         """Select item based on weights"""
-        total_weight = sum(choice["weight"] for choice in choices)
-        r = random.uniform(0, total_weight)
-
-        current_weight = 0
-        for choice in choices:
-            current_weight += choice["weight"]
-            if r <= current_weight:
-                return choice["preference"] if "preference" in choice else choice
-
-        return choices[-1]["preference"] if "preference" in choices[-1] else choices[-1]
+        choice = random.choices(choices, weights=[c["weight"] for c in choices])[0]
+        return choice["preference"] if "preference" in choice else choice
 
     def random_ip(self):
         """Generate random IP address"""
@@ -521,47 +597,28 @@ class Command(BaseCommand):
     def random_user_agent(self, device_type):
         """Generate realistic user agent"""
         if device_type == "mobile":
-            return random.choice(
-                [
-                    "Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15",
-                    "Mozilla/5.0 (Android 11; Mobile; rv:91.0) Gecko/91.0 Firefox/91.0",
-                    "Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36",
-                ]
-            )
+            return random.choice(MOBILE_USER_AGENTS)
         elif device_type == "tablet":
-            return "Mozilla/5.0 (iPad; CPU OS 15_0 like Mac OS X) AppleWebKit/605.1.15"
+            return TABLET_USER_AGENT
         else:
-            return random.choice(
-                [
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-                ]
-            )
+            return random.choice(DESKTOP_USER_AGENTS)
 
     def random_referrer(self, utm_source):
         """Generate realistic referrer URL"""
-        referrers = {
-            "google": "https://www.google.com/",
-            "facebook": "https://www.facebook.com/",
-            "twitter": "https://twitter.com/",
-            "linkedin": "https://www.linkedin.com/",
-            "": "",  # Direct traffic
-        }
-        return referrers.get(utm_source, "")
+        return REFERRERS.get(utm_source, "")
 
     def random_browser(self):
         """Generate random browser"""
-        return random.choice(["Chrome", "Safari", "Firefox", "Edge", "Opera"])
+        return random.choice(BROWSERS)
 
     def random_os(self, device_type):
         """Generate random OS based on device type"""
         if device_type == "mobile":
-            return random.choice(["iOS", "Android"])
+            return random.choice(MOBILE_OSES)
         elif device_type == "tablet":
-            return random.choice(["iOS", "Android", "iPadOS"])
+            return random.choice(TABLET_OSES)
         else:
-            return random.choice(["Windows", "macOS", "Linux"])
+            return random.choice(DESKTOP_OSES)
 
     def show_summary(self):
         """Show summary of created data"""
@@ -569,14 +626,15 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("📊 TEST DATA SUMMARY"))
         self.stdout.write("=" * 50)
 
-        # Session summary
+        # Session summary; the per-source counts add up to the total
         sessions = UserSession.objects.filter(utm_campaign__contains="test")
-        self.stdout.write(f"👥 Total Sessions: {sessions.count()}")
-
-        # Traffic sources
-        sources = (
+        sources = list(
             sessions.values("utm_source").annotate(count=Count("id")).order_by("-count")
         )
+        total_sessions = sum(source["count"] for source in sources)
+        self.stdout.write(f"👥 Total Sessions: {total_sessions}")
+
+        # Traffic sources
         self.stdout.write("\n🚦 Traffic Sources:")
         for source in sources:
             source_name = source["utm_source"] or "Direct"
@@ -590,14 +648,15 @@ class Command(BaseCommand):
                 f'   {device["device_type"].title()}: {device["count"]} sessions'
             )
 
-        # Survey responses
+        # Survey responses, totalled from the preference breakdown
         surveys = SurveyResponse.objects.filter(session__utm_campaign__contains="test")
-        self.stdout.write(f"\n📝 Survey Responses: {surveys.count()}")
-
-        # Preference breakdown
-        preferences = (
+        preferences = list(
             surveys.values("preference").annotate(count=Count("id")).order_by("-count")
         )
+        total_surveys = sum(pref["count"] for pref in preferences)
+        self.stdout.write(f"\n📝 Survey Responses: {total_surveys}")
+
+        # Preference breakdown
         self.stdout.write("\n🎯 Preference Distribution:")
 
         old_prefs = ["nothing", "notification", "updates"]
@@ -607,27 +666,32 @@ class Command(BaseCommand):
         new_total = sum(p["count"] for p in preferences if p["preference"] in new_prefs)
 
         self.stdout.write(
-            f"   📈 Old Preferences (Follow-up): {old_total} ({old_total/surveys.count()*100:.1f}%)"
+            f"   📈 Old Preferences (Follow-up): {old_total} ({old_total/total_surveys*100:.1f}%)"
         )
         for pref in preferences:
             if pref["preference"] in old_prefs:
                 self.stdout.write(f'      {pref["preference"]}: {pref["count"]}')
 
         self.stdout.write(
-            f"   🆕 New Preferences (App Intent): {new_total} ({new_total/surveys.count()*100:.1f}%)"
+            f"   🆕 New Preferences (App Intent): {new_total} ({new_total/total_surveys*100:.1f}%)"
         )
         for pref in preferences:
             if pref["preference"] in new_prefs:
                 self.stdout.write(f'      {pref["preference"]}: {pref["count"]}')
 
         # Signup summary
-        signups = EarlyAccessSignup.objects.filter(email__contains="testuser")
-        self.stdout.write(f"\n✅ Signups: {signups.count()}")
-        self.stdout.write(f"   Verified: {signups.filter(is_verified=True).count()}")
+        signup_stats = EarlyAccessSignup.objects.filter(
+            email__contains="testuser"
+        ).aggregate(
+            total=Count("id"),
+            verified=Count("id", filter=Q(is_verified=True)),
+        )
+        self.stdout.write(f"\n✅ Signups: {signup_stats['total']}")
+        self.stdout.write(f"   Verified: {signup_stats['verified']}")
 
         # Conversion rates
-        if sessions.count() > 0:
-            conversion_rate = (signups.count() / sessions.count()) * 100
+        if total_sessions > 0:
+            conversion_rate = (signup_stats["total"] / total_sessions) * 100
             self.stdout.write(f"\n📈 Overall Conversion Rate: {conversion_rate:.1f}%")
 
         # Daily stats
@@ -14,6 +14,7 @@ import json
 from datetime import timedelta
 
 from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
 from django.utils import timezone
 from tpsq.models import EarlyAccessSignup, SurveyResponse, UserSession
 from tpsq.utils import AnalyticsCalculator, FunnelAnalyzer
@@ -35,10 +36,16 @@ class Command(BaseCommand):
             )
             return
 
+        # Use last 7 days to capture test data; one calculator serves every
+        # check so the preference breakdown is only computed once
+        end_date = timezone.now().date()
+        start_date = end_date - timedelta(days=7)
+        calc = AnalyticsCalculator(start_date, end_date)
+
         self.verify_data_structure()
-        self.verify_analytics_calculations()
+        preferences = self.verify_analytics_calculations(calc)
         self.verify_mixed_preferences()
-        self.verify_insights_generation()
+        self.verify_insights_generation(calc, preferences)
         self.verify_dashboard_compatibility()
 
         self.stdout.write(
@@ -51,30 +58,39 @@ class Command(BaseCommand):
         """Verify basic data structure"""
         self.stdout.write("\n📊 Verifying data structure...")
 
-        # Count test data
+        # Count test data; the survey total and the preference split come
+        # from one conditional aggregate
         test_sessions = UserSession.objects.filter(utm_campaign__contains="test")
-        test_surveys = SurveyResponse.objects.filter(
+        survey_counts = SurveyResponse.objects.filter(
             session__utm_campaign__contains="test"
+        ).aggregate(
+            total=Count("id"),
+            old=Count(
+                "id", filter=Q(preference__in=["nothing", "notification", "updates"])
+            ),
+            new=Count(
+                "id",
+                filter=Q(
+                    preference__in=["yes_would_use", "no_wouldnt_use", "not_sure"]
+                ),
+            ),
         )
         test_signups = EarlyAccessSignup.objects.filter(email__contains="testuser")
 
+        total_surveys = survey_counts["total"]
+        old_prefs = survey_counts["old"]
+        new_prefs = survey_counts["new"]
+
         self.stdout.write(f"   Sessions: {test_sessions.count()}")
-        self.stdout.write(f"   Surveys: {test_surveys.count()}")
+        self.stdout.write(f"   Surveys: {total_surveys}")
         self.stdout.write(f"   Signups: {test_signups.count()}")
 
         # Verify preference distribution
-        old_prefs = test_surveys.filter(
-            preference__in=["nothing", "notification", "updates"]
-        ).count()
-        new_prefs = test_surveys.filter(
-            preference__in=["yes_would_use", "no_wouldnt_use", "not_sure"]
-        ).count()
-
         self.stdout.write(
-            f"   Old preferences: {old_prefs} ({old_prefs/test_surveys.count()*100:.1f}%)"
+            f"   Old preferences: {old_prefs} ({old_prefs/total_surveys*100:.1f}%)"
         )
         self.stdout.write(
-            f"   New preferences: {new_prefs} ({new_prefs/test_surveys.count()*100:.1f}%)"
+            f"   New preferences: {new_prefs} ({new_prefs/total_surveys*100:.1f}%)"
         )
 
         # Check that new preferences dominate
@@ -87,16 +103,15 @@ class Command(BaseCommand):
                 self.style.WARNING("   ⚠️  Expected new preferences to dominate")
             )
 
-    def verify_analytics_calculations(self):
-        """Test analytics calculations with mixed data"""
-        self.stdout.write("\n🧮 Testing analytics calculations...")
-
-        # Use last 7 days to capture test data
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=7)
+    def verify_analytics_calculations(self, calc):
+        """
+        Test analytics calculations with mixed data.
 
-        calc = AnalyticsCalculator(start_date, end_date)
+        Returns the preference breakdown, or None if the calculations failed.
+        """
+        self.stdout.write("\n🧮 Testing analytics calculations...")
 
+        preferences = None
         try:
             # Test basic funnel calculation
             funnel = calc.get_conversion_funnel()
@@ -149,14 +164,27 @@ class Command(BaseCommand):
                 self.style.ERROR(f"   ❌ Analytics calculation error: {str(e)}")
             )
 
+        return preferences
+
     def verify_mixed_preferences(self):
         """Test mixed preference handling"""
         self.stdout.write("\n🔀 Testing mixed preference handling...")
 
-        # Test preference model methods
+        # Test preference model methods; question_type and engagement_level
+        # are derived from preference alone, so that is all we load
         test_surveys = SurveyResponse.objects.filter(
             session__utm_campaign__contains="test"
-        )
+        ).only("preference")
+
+        # Verify engagement level mapping
+        expected_levels = {
+            "nothing": "low",
+            "notification": "medium",
+            "updates": "high",
+            "no_wouldnt_use": "low",
+            "not_sure": "medium",
+            "yes_would_use": "high",
+        }
 
         old_pref_count = 0
         new_pref_count = 0
@@ -170,16 +198,6 @@ class Command(BaseCommand):
             elif question_type == "app_usage_intent":
                 new_pref_count += 1
 
-            # Verify engagement level mapping
-            expected_levels = {
-                "nothing": "low",
-                "notification": "medium",
-                "updates": "high",
-                "no_wouldnt_use": "low",
-                "not_sure": "medium",
-                "yes_would_use": "high",
-            }
-
             expected_level = expected_levels.get(survey.preference, "unknown")
             if engagement_level != expected_level:
                 self.stdout.write(
@@ -193,17 +211,13 @@ class Command(BaseCommand):
         )
         self.stdout.write(self.style.SUCCESS("   ✅ Mixed preference handling working"))
 
-    def verify_insights_generation(self):
+    def verify_insights_generation(self, calc, preferences=None):
         """Test insight generation with mixed data"""
         self.stdout.write("\n💡 Testing insights generation...")
 
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=7)
-
-        calc = AnalyticsCalculator(start_date, start_date)
-
         try:
-            preferences = calc.get_user_preferences_breakdown()
+            if preferences is None:
+                preferences = calc.get_user_preferences_breakdown()
             insights = preferences.get("insights", [])
 
             self.stdout.write(f"   Generated {len(insights)} insights:")
@@ -224,7 +238,9 @@ class Command(BaseCommand):
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING("   ⚠️  No mixed-data specific insights detected")
+                    self.style.WARNING(
+                        "   ⚠️  No mixed-data specific insights detected"
+                    )
                 )
 
         except Exception as e:
@@ -239,15 +255,16 @@ class Command(BaseCommand):
         try:
             # Simulate dashboard data request
             from django.contrib.auth.models import User
-            from django.test import Client
-
-            client = Client()
+            from django.test import RequestFactory
+            from tpsq.views import dashboard_stats
 
-            # Test dashboard stats API
-            response = client.get("/api/dashboard-stats/?days=7")
+            # Call the view directly; routing and the middleware stack are
+            # not what this checks
+            request = RequestFactory().get("/api/dashboard-stats/?days=7")
+            response = dashboard_stats(request)
 
             if response.status_code == 200:
-                data = response.json()
+                data = response.data
 
                 # Check for preference data
                 if "preferences" in data:
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-16 18:39
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tpsq", "0007_alter_pretotypeissue_media_type"),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddIndex(
+            model_name="usersession",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["utm_campaign"],
+                name="user_session_utm_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
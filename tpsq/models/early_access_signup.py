@@ -1,6 +1,7 @@
 import uuid
 
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import EmailValidator, RegexValidator
 from django.db import models
 from django.utils import timezone
@@ -118,6 +119,12 @@ class UserSession(models.Model):
             models.Index(fields=["device_type", "first_seen"]),
             models.Index(fields=["utm_campaign", "first_seen"]),
             models.Index(fields=["is_bounce", "first_seen"]),
+            # Trigram index so utm_campaign__contains can avoid a seq scan
+            GinIndex(
+                fields=["utm_campaign"],
+                opclasses=["gin_trgm_ops"],
+                name="user_session_utm_trgm_idx",
+            ),
         ]
         ordering = ["-first_seen"]
 
@@ -156,6 +163,8 @@ class FunnelEvent(models.Model):
         ("signup_success", "Signup Successful"),
         ("page_exit", "Page Exit"),
     ]
+    # Built once; get_event_type_display() rebuilds a dict on every call
+    EVENT_TYPE_LABELS = dict(EVENT_TYPES)
 
     # Relationships
     session = models.ForeignKey(
@@ -213,7 +222,8 @@ class FunnelEvent(models.Model):
 
     def __str__(self):
         return (
-            f"{self.get_event_type_display()} - {self.timestamp.strftime('%H:%M:%S')}"
+            f"{self.EVENT_TYPE_LABELS.get(self.event_type, self.event_type)}"
+            f" - {self.timestamp.strftime('%H:%M:%S')}"
         )
 
 
@@ -233,6 +243,8 @@ class SurveyResponse(models.Model):
         ("no_wouldnt_use", "No, I wouldn't"),
         ("not_sure", "Not sure"),
     ]
+    # Built once; get_preference_display() rebuilds a dict on every call
+    PREFERENCE_LABELS = dict(PREFERENCE_CHOICES)
 
     # Relationships
     session = models.OneToOneField(
@@ -267,7 +279,8 @@ class SurveyResponse(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self):
-        return f"{self.get_preference_display()} - {self.created_at.date()}"
+        label = self.PREFERENCE_LABELS.get(self.preference, self.preference)
+        return f"{label} - {self.created_at.date()}"
 
     @property
     def engagement_level(self):
@@ -375,7 +388,13 @@ class EarlyAccessSignup(models.Model):
 
     @property
     def has_survey_response(self):
-        """Check if signup includes survey data"""
+        """
+        Check if signup includes survey data.
+
+        This and the other session-derived properties below follow the
+        session and session.survey relations, so querysets that use them
+        per row should select_related("session", "session__survey").
+        """
         return self.session and hasattr(self.session, "survey")
 
     @property
@@ -474,8 +493,22 @@ class DailyStats(models.Model):
     def __str__(self):
         return f"Stats for {self.date} - {self.signups} signups"
 
-    def calculate_rates(self):
-        """Calculate and update conversion rates"""
+    # Columns written by calculate_rates()
+    RATE_FIELDS = [
+        "click_through_rate",
+        "page_conversion_rate",
+        "overall_conversion_rate",
+        "survey_completion_rate",
+        "bounce_rate",
+    ]
+
+    def calculate_rates(self, save=True, bounce_sessions=None):
+        """
+        Calculate and update conversion rates.
+
+        Pass save=False to only set the fields, e.g. before a bulk_update(),
+        and bounce_sessions when the day's bounce count is already known.
+        """
         if self.ad_impressions > 0:
             self.click_through_rate = round(
                 (self.ad_clicks / self.ad_impressions) * 100, 2
@@ -494,17 +527,11 @@ class DailyStats(models.Model):
             )
 
         if self.unique_visitors > 0:
-            bounce_sessions = UserSession.objects.filter(
-                first_seen__date=self.date, is_bounce=True
-            ).count()
+            if bounce_sessions is None:
+                bounce_sessions = UserSession.objects.filter(
+                    first_seen__date=self.date, is_bounce=True
+                ).count()
             self.bounce_rate = round((bounce_sessions / self.unique_visitors) * 100, 2)
 
-        self.save(
-            update_fields=[
-                "click_through_rate",
-                "page_conversion_rate",
-                "overall_conversion_rate",
-                "survey_completion_rate",
-                "bounce_rate",
-            ]
-        )
+        if save:
+            self.save(update_fields=self.RATE_FIELDS)
@@ -338,7 +338,11 @@ class PretotypeIssue(models.Model):
         return f"{self.get_issue_type_display()} - {self.submitted_at.date()}"
 
     def save(self, *args, **kwargs):
-        # Auto-calculate derived fields
+        self.set_derived_fields()
+        super().save(*args, **kwargs)
+
+    def set_derived_fields(self):
+        """Auto-calculate derived fields; call before bulk_create()"""
         self.has_details = bool(self.issue_details.strip())
         if self.has_details:
             self.details_word_count = len(self.issue_details.split())
@@ -358,8 +362,6 @@ class PretotypeIssue(models.Model):
             indicator in issue_text for indicator in test_indicators
         )
 
-        super().save(*args, **kwargs)
-
     @property
     def primary_media_url(self):
         """Get the primary media URL, prioritizing new field over deprecated ones"""
@@ -29,10 +29,12 @@ IMPORTANT FIXES NEEDED IN VIEWS.PY:
 import uuid
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from io import StringIO
 from unittest.mock import patch
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.db import IntegrityError, transaction
 from django.test import TestCase, TransactionTestCase
 from django.urls import reverse
@@ -382,6 +384,28 @@ class DailyStatsModelTests(TestCase):
         with self.assertRaises(IntegrityError):
             DailyStats.objects.create(date=today, page_views=200)
 
+    def test_test_data_rerun_keeps_ad_rates(self):
+        """Test re-running the test data generator keeps existing ad metrics"""
+        today = timezone.now().date()
+        stats = DailyStats.objects.create(
+            date=today, ad_impressions=50, ad_clicks=7, page_views=40, signups=5
+        )
+        stats.calculate_rates()
+        self.assertEqual(stats.click_through_rate, 14.0)
+        self.assertEqual(stats.overall_conversion_rate, 10.0)
+
+        call_command(
+            "create_test_analytics_data", days=1, sessions=20, stdout=StringIO()
+        )
+
+        stats.refresh_from_db()
+        self.assertEqual(stats.ad_impressions, 50)
+        self.assertEqual(stats.ad_clicks, 7)
+        self.assertEqual(stats.click_through_rate, 14.0)
+        self.assertEqual(
+            stats.overall_conversion_rate, round(stats.signups / 50 * 100, 2)
+        )
+
 
 # =============================================================================
 # SERIALIZER TESTS - Data Validation and Transformation